@@ -1,5 +1,6 @@
+from collections import deque
 from pandaplot.commands.base_command import Command
-from typing import List, Optional
+from typing import Deque, List, Optional
 
 class CommandExecutor:
     """
@@ -8,10 +9,22 @@ class CommandExecutor:
     """
     
     def __init__(self):
-        # Undo/Redo functionality
-        self.undo_stack: List[Command] = []
+        # Undo/Redo functionality; the bounded deque drops the oldest command
+        # in O(1) once max_undo_levels is reached
+        self._max_undo_levels = 10
+        self.undo_stack: Deque[Command] = deque(maxlen=self._max_undo_levels)
         self.redo_stack: List[Command] = []
-        self.max_undo_levels = 10
+    
+    @property
+    def max_undo_levels(self) -> int:
+        """Maximum number of commands kept on the undo stack."""
+        return self._max_undo_levels
+    
+    @max_undo_levels.setter
+    def max_undo_levels(self, value: int):
+        # A deque's maxlen is fixed, so rebuild it; the oldest commands are dropped
+        self._max_undo_levels = value
+        self.undo_stack = deque(self.undo_stack, maxlen=value)
     
     def execute_command(self, command: Command) -> bool:
         """
@@ -26,11 +39,9 @@ class CommandExecutor:
         try:
             command.execute()
             
-            # Add to undo stack
+            # Add to undo stack, evicting the oldest command when full
+            #TODO: ensure we clean command references properly
             self.undo_stack.append(command)
-            if len(self.undo_stack) > self.max_undo_levels:
-                #TODO: ensure we clean command references properly
-                self.undo_stack.pop(0)
                 
             # Clear redo stack since we executed a new command
             self.redo_stack.clear()
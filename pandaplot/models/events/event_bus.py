@@ -1,17 +1,71 @@
 from collections import defaultdict
+import logging
 import re
-from typing import Callable, Dict, Any
+import sys
+import types
+from typing import Callable, Dict, Any, Iterable, List, Tuple
+import weakref
 from .event_types import EventHierarchy
 
+logger = logging.getLogger(__name__)
+
+
+class _WeakCallback:
+    """Calls a bound method without keeping its instance alive.
+    
+    When the instance is garbage collected the subscription removes itself
+    from the bus. Compares equal to the bound method it wraps, so
+    unsubscribe() works with the original callback.
+    """
+    
+    def __init__(self, method: types.MethodType, event_bus: 'EventBus', event_pattern: str):
+        def on_dead(ref):
+            event_bus.unsubscribe(event_pattern, self)
+        
+        self._ref = weakref.WeakMethod(method, on_dead)
+    
+    def __call__(self, data: Dict[str, Any]) -> None:
+        method = self._ref()
+        if method is not None:
+            method(data)
+    
+    def __eq__(self, other):
+        if other is self:
+            return True
+        method = self._ref()
+        if method is None:
+            return False
+        if isinstance(other, _WeakCallback):
+            other = other._ref()
+        return method == other
+    
+    __hash__ = None
+
 
 class EventBus:
     """
     Event bus for communication between components.
     """
     
-    def __init__(self):
-        self._subscribers = defaultdict(list)
+    __slots__ = ('_propagate_exceptions', '_subscribers', '_pattern_subscribers', '_pattern_cache')
+    
+    def __init__(self, propagate_exceptions: bool = False):
+        """Create an event bus.
+        
+        Args:
+            propagate_exceptions: Re-raise callback exceptions out of emit()
+                instead of logging them and continuing with the next callback
+        """
+        self._propagate_exceptions = propagate_exceptions
+        # Maps event type -> single callback, promoted to a tuple of callbacks
+        # on the second subscribe. Most events have zero or one subscriber.
+        # Tuples are rebuilt on (un)subscribe, so emit can iterate them
+        # without a copy even if a callback changes the subscriptions.
+        self._subscribers: Dict[str, Any] = {}
         self._pattern_subscribers = defaultdict(list)
+        # Event type -> callbacks of all matching patterns, in subscription
+        # order. Cleared whenever a pattern subscription changes.
+        self._pattern_cache: Dict[str, Tuple[Callable[[Dict[str, Any]], None], ...]] = {}
 
     def subscribe(self, event_pattern: str, callback: Callable[[Dict[str, Any]], None]) -> None:
         """Subscribe to events matching a pattern.
@@ -19,13 +73,27 @@ class EventBus:
         Args:
             event_pattern: Event name or pattern (e.g., "dataset.changed" or "dataset.*")
             callback: Function to call when event matches
+            
+        Bound methods are held weakly: subscribing does not keep the instance
+        alive, and its subscriptions are dropped once it is garbage collected.
         """
+        if isinstance(callback, types.MethodType):
+            callback = _WeakCallback(callback, self, event_pattern)
+        
         if '*' in event_pattern:
-            # Convert glob pattern to regex
-            regex_pattern = event_pattern.replace('.', r'\.').replace('*', '.*')
-            self._pattern_subscribers[regex_pattern].append(callback)
+            self._pattern_subscribers[self._compile_pattern(event_pattern)].append(callback)
+            self._pattern_cache.clear()
         else:
-            self._subscribers[event_pattern].append(callback)
+            # Interned keys let emits with literal event names (including the
+            # EventHierarchy levels) match by identity in the dict lookup.
+            event_pattern = sys.intern(event_pattern)
+            existing = self._subscribers.get(event_pattern)
+            if existing is None:
+                self._subscribers[event_pattern] = callback
+            elif type(existing) is tuple:
+                self._subscribers[event_pattern] = existing + (callback,)
+            else:
+                self._subscribers[event_pattern] = (existing, callback)
 
     def unsubscribe(self, event_pattern: str, callback: Callable[[Dict[str, Any]], None]) -> None:
         """Remove a subscription.
@@ -35,12 +103,61 @@ class EventBus:
             callback: The same callback function used in subscribe
         """
         if '*' in event_pattern:
-            regex_pattern = event_pattern.replace('.', r'\.').replace('*', '.*')
-            if callback in self._pattern_subscribers[regex_pattern]:
-                self._pattern_subscribers[regex_pattern].remove(callback)
+            regex_pattern = self._compile_pattern(event_pattern)
+            callbacks = self._pattern_subscribers.get(regex_pattern)
+            if callbacks and callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._pattern_subscribers[regex_pattern]
+                self._pattern_cache.clear()
         else:
-            if callback in self._subscribers[event_pattern]:
-                self._subscribers[event_pattern].remove(callback)
+            existing = self._subscribers.get(event_pattern)
+            if existing is None:
+                return
+            if type(existing) is tuple:
+                if callback in existing:
+                    index = existing.index(callback)
+                    remaining = existing[:index] + existing[index + 1:]
+                    self._subscribers[event_pattern] = (
+                        remaining if len(remaining) > 1 else remaining[0])
+            elif existing == callback:
+                del self._subscribers[event_pattern]
+
+    @staticmethod
+    def _compile_pattern(event_pattern: str) -> re.Pattern:
+        """Convert a glob event pattern to a compiled regex.
+        
+        Compiled patterns hash and compare by their source, so the result
+        can key _pattern_subscribers for both subscribe and unsubscribe.
+        """
+        return re.compile(event_pattern.replace('.', r'\.').replace('*', '.*'))
+
+    def _match_patterns(self, event_type: str) -> Tuple[Callable[[Dict[str, Any]], None], ...]:
+        """Resolve and cache the pattern subscribers of an event type."""
+        matched = tuple(
+            callback
+            for pattern, callbacks in self._pattern_subscribers.items()
+            if pattern.match(event_type)
+            for callback in callbacks
+        )
+        self._pattern_cache[event_type] = matched
+        return matched
+
+    def get_subscribers(self, event_type: str) -> List[Callable[[Dict[str, Any]], None]]:
+        """Get the exact-match subscribers of an event type.
+        
+        Args:
+            event_type: The event type to look up
+            
+        Returns:
+            A new list of callbacks, empty if the event has no subscribers
+        """
+        existing = self._subscribers.get(event_type)
+        if existing is None:
+            return []
+        if type(existing) is tuple:
+            return list(existing)
+        return [existing]
 
     def emit(self, event_type: str, data: Dict[str, Any] | None = None) -> None:
         """Emit an event with automatic hierarchy support.
@@ -50,36 +167,73 @@ class EventBus:
             data: Event data dictionary
             
         This automatically emits parent events in the hierarchy based on EventHierarchy mapping.
+        Levels without subscribers cost a single dict lookup; no payload is built for them.
         """
-        if data is None:
-            data = {}
-        
         # Get hierarchy for this event type
         hierarchy = EventHierarchy.get_hierarchy(event_type)
         
-        # Emit events from specific to generic
+        # Emit events from specific to generic. Each level gets its own dict,
+        # shared by that level's subscribers; copy() plus two stores is faster
+        # than a {**data, ...} merge for the small payloads used here.
         for event_level in hierarchy:
-            event_data = data.copy()
-            event_data['event_type'] = event_level
-            event_data['original_event'] = event_type
+            # Most levels have no listeners; skip them before building a payload
+            subscribers = self._subscribers.get(event_level)
+            if self._pattern_subscribers:
+                pattern_callbacks = self._pattern_cache.get(event_level)
+                if pattern_callbacks is None:
+                    pattern_callbacks = self._match_patterns(event_level)
+            else:
+                pattern_callbacks = ()
+            if subscribers is None and not pattern_callbacks:
+                continue
+            
+            if data:
+                event_data = data.copy()
+                event_data['event_type'] = event_level
+                event_data['original_event'] = event_type
+            else:
+                event_data = {'event_type': event_level, 'original_event': event_type}
             
             # Emit to exact subscribers
-            for callback in self._subscribers[event_level]:
+            if subscribers is None:
+                pass
+            elif type(subscribers) is not tuple:
                 try:
-                    callback(event_data)
-                except Exception as e:
-                    print(f"Error in event callback for {event_level}: {e}")
+                    subscribers(event_data)
+                except Exception:
+                    if self._propagate_exceptions:
+                        raise
+                    logger.exception("Error in event callback for %s", event_level)
+            else:
+                for callback in subscribers:
+                    try:
+                        callback(event_data)
+                    except Exception:
+                        if self._propagate_exceptions:
+                            raise
+                        logger.exception("Error in event callback for %s", event_level)
             
             # Emit to pattern subscribers
-            for pattern, callbacks in self._pattern_subscribers.items():
-                if re.match(pattern, event_level):
-                    for callback in callbacks:
-                        try:
-                            callback(event_data)
-                        except Exception as e:
-                            print(f"Error in pattern callback for {event_level}: {e}")
+            for callback in pattern_callbacks:
+                try:
+                    callback(event_data)
+                except Exception:
+                    if self._propagate_exceptions:
+                        raise
+                    logger.exception("Error in pattern callback for %s", event_level)
+
+    def emit_many(self, events: Iterable[Tuple[str, Dict[str, Any] | None]]) -> None:
+        """Emit a batch of events in order.
+        
+        Args:
+            events: (event_type, data) pairs, each emitted as by emit()
+        """
+        emit = self.emit
+        for event_type, data in events:
+            emit(event_type, data)
 
     def clear_all_subscriptions(self) -> None:
         """Clear all subscriptions - useful for testing."""
         self._subscribers.clear()
         self._pattern_subscribers.clear()
+        self._pattern_cache.clear()
@@ -4,6 +4,8 @@ from typing import Any, Callable
 class Event:
     """Base class for events."""
 
+    __slots__ = ('event_type', 'data')
+
     def __init__(self, event_type: str, data: Any = None):
         self.event_type = event_type
         self.data = data
@@ -22,31 +24,48 @@ class Observable:
     """Class to manage observers and notify them of events."""
 
     def __init__(self):
-        self._observers: set[Observer] = set()
+        # Observers and observer callbacks in the order they were added; the
+        # set mirrors the list so duplicate checks stay O(1). _callbacks holds
+        # the callable notify invokes for each entry (observer.update or the
+        # callback itself), index-aligned with _observers. It is a tuple
+        # rebuilt on every change, so notify iterates a stable snapshot.
+        self._observers: list[Observer | Callable[[Event], None]] = []
+        self._observer_set: set[Observer | Callable[[Event], None]] = set()
+        self._callbacks: tuple[Callable[[Event], None], ...] = ()
 
     def add_observer(self, observer: Observer):
         """Add an observer to the list if not already present."""
-        if observer not in self._observers:
-            self._observers.add(observer)
+        self._add(observer, observer.update)
     
     def add_observer_callback(self, callback: Callable[[Event], None]):
-        """Add a callback as an observer."""
-        class CallbackObserver(Observer):
-            def update(self, event: Event):
-                callback(event)
+        """Add a callback as an observer.
+        
+        The callback can later be removed with remove_observer(callback).
+        """
+        self._add(callback, callback)
 
-        self.add_observer(CallbackObserver())
+    def _add(self, observer: Observer | Callable[[Event], None], callback: Callable[[Event], None]):
+        """Register an entry with the callable notify invokes for it."""
+        if observer not in self._observer_set:
+            self._observer_set.add(observer)
+            self._observers.append(observer)
+            self._callbacks += (callback,)
 
-    def remove_observer(self, observer: Observer):
-        """Remove an observer from the list if present."""
-        if observer in self._observers:
-            self._observers.remove(observer)
+    def remove_observer(self, observer: Observer | Callable[[Event], None]):
+        """Remove an observer (or observer callback) from the list if present."""
+        if observer in self._observer_set:
+            self._observer_set.remove(observer)
+            index = self._observers.index(observer)
+            del self._observers[index]
+            self._callbacks = self._callbacks[:index] + self._callbacks[index + 1:]
 
     def notify(self, event: Event):
         """Notify all observers of an event."""
-        for observer in self._observers:
-            observer.update(event)
+        for callback in self._callbacks:
+            callback(event)
 
     def clear_observers(self):
         """Clear all observers."""
         self._observers.clear()
+        self._observer_set.clear()
+        self._callbacks = ()
@@ -0,0 +1,71 @@
+"""
+Shared fixtures for command tests.
+
+Test classes that need a different setup (e.g. a real Project) override these
+by defining fixtures with the same name.
+"""
+
+from pathlib import Path
+
+import pytest
+from unittest.mock import Mock, create_autospec
+
+from pandaplot.models.project.project import Project
+from pandaplot.models.state.app_context import AppContext
+from pandaplot.models.state.app_state import AppState
+from pandaplot.gui.controllers.ui_controller import UIController
+
+_COMMANDS_TEST_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """Mark every test under tests/commands with ``commands``."""
+    for item in items:
+        if _COMMANDS_TEST_DIR in item.path.parents:
+            item.add_marker(pytest.mark.commands)
+
+
+@pytest.fixture(scope="session")
+def _mock_app_context_template():
+    """Build the spec'd mocks once per session; spec introspection is the costly part.
+
+    AppContext and UIController are autospecced so calls with a wrong signature
+    fail. AppState keeps a plain spec because event_bus is assigned in __init__
+    and would be rejected by spec_set.
+    """
+    return (
+        create_autospec(AppContext, instance=True, spec_set=True),
+        Mock(spec=AppState),
+        create_autospec(UIController, instance=True, spec_set=True),
+    )
+
+
+@pytest.fixture
+def mock_app_context(_mock_app_context_template):
+    """Create mock app context with all dependencies, reset for this test."""
+    app_context, app_state, ui_controller = _mock_app_context_template
+    for mock in (app_context, app_state, ui_controller):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    app_context.get_app_state.return_value = app_state
+    app_context.get_ui_controller.return_value = ui_controller
+    app_state.has_project = False
+    app_state.current_project = None
+
+    # Setup event bus
+    app_state.event_bus = Mock()
+
+    return app_context, app_state, ui_controller
+
+
+@pytest.fixture(scope="session")
+def _sample_project_template():
+    """Build the mocked sample project once per session."""
+    return Mock(spec_set=Project)
+
+
+@pytest.fixture
+def sample_project(_sample_project_template):
+    """Create a mocked sample project for testing, reset for this test."""
+    _sample_project_template.reset_mock(return_value=True, side_effect=True)
+    return _sample_project_template
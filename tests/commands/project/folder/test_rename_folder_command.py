@@ -9,6 +9,17 @@ from pandaplot.models.state.app_state import AppState
 from pandaplot.gui.controllers.ui_controller import UIController
 
 
+def _assert_rename_event(emit_mock, project, folder_id, old_name, new_name, folder):
+    """Assert a single 'folder_renamed' event was emitted with the given data."""
+    emit_mock.assert_called_once_with('folder_renamed', {
+        'project': project,
+        'folder_id': folder_id,
+        'old_name': old_name,
+        'new_name': new_name,
+        'folder': folder
+    })
+
+
 class TestRenameFolderCommand:
     """Test suite for RenameFolderCommand."""
     
@@ -24,7 +35,6 @@ class TestRenameFolderCommand:
         
         # Setup event bus
         app_state.event_bus = Mock()
-        app_state.event_bus.emit = Mock()
         
         return app_context, app_state, ui_controller
     
@@ -35,6 +45,14 @@ class TestRenameFolderCommand:
         project.find_item = Mock()
         return project
 
+    @pytest.fixture
+    def loaded_project(self, mock_app_context, sample_project):
+        """Mock app context with sample_project loaded as the current project."""
+        app_context, app_state, ui_controller = mock_app_context
+        app_state.has_project = True
+        app_state.current_project = sample_project
+        return app_context, app_state, ui_controller, sample_project
+
     @pytest.fixture
     def sample_folder(self):
         """Create a sample folder for testing."""
@@ -42,27 +60,21 @@ class TestRenameFolderCommand:
         folder.name = "Original Folder"
         return folder
 
-    def test_init_default_values(self, mock_app_context):
-        """Test command initialization with default values."""
+    @pytest.mark.parametrize("folder_id,new_name", [
+        (None, None),
+        ("folder-123", "New Folder Name"),
+    ], ids=["defaults", "with_parameters"])
+    def test_init(self, mock_app_context, folder_id, new_name):
+        """Test command initialization with default values and with parameters."""
         app_context, app_state, ui_controller = mock_app_context
         
-        command = RenameFolderCommand(app_context)
+        command = RenameFolderCommand(app_context, folder_id, new_name)
         
         assert command.app_context == app_context
         assert command.app_state == app_state
         assert command.ui_controller == ui_controller
-        assert command.folder_id is None
-        assert command.new_name is None
-        assert command.old_name is None
-
-    def test_init_with_parameters(self, mock_app_context):
-        """Test command initialization with parameters."""
-        app_context, app_state, ui_controller = mock_app_context
-        
-        command = RenameFolderCommand(app_context, "folder-123", "New Folder Name")
-        
-        assert command.folder_id == "folder-123"
-        assert command.new_name == "New Folder Name"
+        assert command.folder_id == folder_id
+        assert command.new_name == new_name
         assert command.old_name is None
 
     def test_execute_no_project_loaded(self, mock_app_context):
@@ -90,11 +102,9 @@ class TestRenameFolderCommand:
         
         assert result is False
 
-    def test_execute_no_folder_id(self, mock_app_context, sample_project):
+    def test_execute_no_folder_id(self, loaded_project):
         """Test execute when folder ID is not provided."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         command = RenameFolderCommand(app_context, None, "New Name")
         result = command.execute()
@@ -105,11 +115,9 @@ class TestRenameFolderCommand:
             "Folder ID and new name are required."
         )
 
-    def test_execute_no_new_name(self, mock_app_context, sample_project):
+    def test_execute_no_new_name(self, loaded_project):
         """Test execute when new name is not provided."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         command = RenameFolderCommand(app_context, "folder-123", None)
         result = command.execute()
@@ -120,11 +128,9 @@ class TestRenameFolderCommand:
             "Folder ID and new name are required."
         )
 
-    def test_execute_folder_not_found(self, mock_app_context, sample_project):
+    def test_execute_folder_not_found(self, loaded_project):
         """Test execute when folder is not found."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         # find_item returns None
         sample_project.find_item.return_value = None
@@ -139,11 +145,9 @@ class TestRenameFolderCommand:
             "Folder with ID 'folder-123' not found in the project."
         )
 
-    def test_execute_item_not_folder(self, mock_app_context, sample_project):
+    def test_execute_item_not_folder(self, loaded_project):
         """Test execute when found item is not a Folder."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         # find_item returns a non-Folder object
         not_a_folder = Mock()
@@ -158,11 +162,9 @@ class TestRenameFolderCommand:
             "Folder with ID 'folder-123' not found in the project."
         )
 
-    def test_execute_successful(self, mock_app_context, sample_project, sample_folder):
+    def test_execute_successful(self, loaded_project, sample_folder):
         """Test successful execute operation."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_folder
         
@@ -174,19 +176,18 @@ class TestRenameFolderCommand:
         assert sample_folder.name == "Renamed Folder"
         
         # Check event emission
-        app_state.event_bus.emit.assert_called_once_with('folder_renamed', {
-            'project': sample_project,
-            'folder_id': "folder-123",
-            'old_name': "Original Folder",
-            'new_name': "Renamed Folder",
-            'folder': sample_folder
-        })
-
-    def test_execute_with_exception(self, mock_app_context, sample_project, sample_folder):
-        """Test execute when an exception occurs."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        _assert_rename_event(app_state.event_bus.emit, sample_project, "folder-123",
+                             "Original Folder", "Renamed Folder", sample_folder)
+
+    @pytest.mark.parametrize("method_name,expected_prefix", [
+        ("execute", "Failed to rename folder"),
+        ("undo", "Failed to undo rename folder"),
+        ("redo", "Failed to redo rename folder"),
+    ])
+    def test_with_exception(self, loaded_project, sample_folder,
+                            method_name, expected_prefix):
+        """Test execute, undo and redo when an exception occurs."""
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_folder
         
@@ -194,20 +195,22 @@ class TestRenameFolderCommand:
         def setter_with_exception(self, value):
             raise Exception("Test error")
         
-        type(sample_folder).name = property(lambda self: "Original", setter_with_exception)
+        type(sample_folder).name = property(lambda self: "Current", setter_with_exception)
         
         command = RenameFolderCommand(app_context, "folder-123", "New Name")
-        result = command.execute()
+        if method_name != "execute":
+            command.old_name = "Original Name"  # Simulate execute was called
+        
+        result = getattr(command, method_name)()
         
         assert result is False
         ui_controller.show_error_message.assert_called_once()
-        assert "Failed to rename folder: Test error" in ui_controller.show_error_message.call_args[0][1]
+        (_, message), _ = ui_controller.show_error_message.call_args
+        assert f"{expected_prefix}: Test error" in message
 
-    def test_undo_successful(self, mock_app_context, sample_project, sample_folder):
+    def test_undo_successful(self, loaded_project, sample_folder):
         """Test successful undo operation."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_folder
         sample_folder.name = "New Name"  # Simulate it was renamed
@@ -221,13 +224,8 @@ class TestRenameFolderCommand:
         assert sample_folder.name == "Original Name"
         
         # Check event emission
-        app_state.event_bus.emit.assert_called_once_with('folder_renamed', {
-            'project': sample_project,
-            'folder_id': "folder-123",
-            'old_name': "New Name",
-            'new_name': "Original Name",
-            'folder': sample_folder
-        })
+        _assert_rename_event(app_state.event_bus.emit, sample_project, "folder-123",
+                             "New Name", "Original Name", sample_folder)
 
     def test_undo_no_old_name(self, mock_app_context):
         """Test undo when no old name is stored."""
@@ -282,11 +280,9 @@ class TestRenameFolderCommand:
             "No project is currently loaded."
         )
 
-    def test_undo_folder_not_found(self, mock_app_context, sample_project):
+    def test_undo_folder_not_found(self, loaded_project):
         """Test undo when folder is not found."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = None
         
@@ -301,11 +297,9 @@ class TestRenameFolderCommand:
             "Folder with ID 'folder-123' not found in the project."
         )
 
-    def test_undo_item_not_folder(self, mock_app_context, sample_project):
+    def test_undo_item_not_folder(self, loaded_project):
         """Test undo when found item is not a Folder."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         not_a_folder = Mock()
         sample_project.find_item.return_value = not_a_folder
@@ -321,34 +315,9 @@ class TestRenameFolderCommand:
             "Folder with ID 'folder-123' not found in the project."
         )
 
-    def test_undo_with_exception(self, mock_app_context, sample_project, sample_folder):
-        """Test undo when an exception occurs."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = sample_folder
-        
-        # Make setting name raise an exception
-        def setter_with_exception(self, value):
-            raise Exception("Test error")
-        
-        type(sample_folder).name = property(lambda self: "Current", setter_with_exception)
-        
-        command = RenameFolderCommand(app_context, "folder-123", "New Name")
-        command.old_name = "Original Name"
-        
-        result = command.undo()
-        
-        assert result is False
-        ui_controller.show_error_message.assert_called_once()
-        assert "Failed to undo rename folder: Test error" in ui_controller.show_error_message.call_args[0][1]
-
-    def test_redo_successful(self, mock_app_context, sample_project, sample_folder):
+    def test_redo_successful(self, loaded_project, sample_folder):
         """Test successful redo operation."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_folder
         sample_folder.name = "Original Name"  # Simulate it was undone
@@ -362,13 +331,8 @@ class TestRenameFolderCommand:
         assert sample_folder.name == "New Name"
         
         # Check event emission
-        app_state.event_bus.emit.assert_called_once_with('folder_renamed', {
-            'project': sample_project,
-            'folder_id': "folder-123",
-            'old_name': "Original Name",
-            'new_name': "New Name",
-            'folder': sample_folder
-        })
+        _assert_rename_event(app_state.event_bus.emit, sample_project, "folder-123",
+                             "Original Name", "New Name", sample_folder)
 
     def test_redo_no_old_name(self, mock_app_context):
         """Test redo when no old name is stored."""
@@ -380,106 +344,41 @@ class TestRenameFolderCommand:
         
         assert result is False
 
-    def test_redo_no_folder_id(self, mock_app_context):
-        """Test redo when no folder ID is stored."""
-        app_context, app_state, ui_controller = mock_app_context
-        
-        command = RenameFolderCommand(app_context, None, "New Name")
-        command.old_name = "Original Name"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_no_new_name(self, mock_app_context):
-        """Test redo when no new name is stored."""
-        app_context, app_state, ui_controller = mock_app_context
-        
-        command = RenameFolderCommand(app_context, "folder-123", None)
-        command.old_name = "Original Name"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_no_project(self, mock_app_context):
-        """Test redo when no project is loaded."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = False
-        
-        command = RenameFolderCommand(app_context, "folder-123", "New Name")
-        command.old_name = "Original Name"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_no_current_project(self, mock_app_context):
-        """Test redo when current project is None."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = None
-        
-        command = RenameFolderCommand(app_context, "folder-123", "New Name")
-        command.old_name = "Original Name"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_folder_not_found(self, mock_app_context, sample_project):
-        """Test redo when folder is not found."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = None
-        
-        command = RenameFolderCommand(app_context, "folder-123", "New Name")
-        command.old_name = "Original Name"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_item_not_folder(self, mock_app_context, sample_project):
-        """Test redo when found item is not a Folder."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        not_a_folder = Mock()
-        sample_project.find_item.return_value = not_a_folder
-        
-        command = RenameFolderCommand(app_context, "folder-123", "New Name")
-        command.old_name = "Original Name"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_with_exception(self, mock_app_context, sample_project, sample_folder):
-        """Test redo when an exception occurs."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
+    @pytest.mark.parametrize("scenario", [
+        "no_folder_id",
+        "no_new_name",
+        "no_project",
+        "no_current_project",
+        "folder_not_found",
+        "item_not_folder",
+    ])
+    def test_redo_failure_paths(self, loaded_project, sample_folder, scenario):
+        """Test redo returns False when any of its preconditions is not met."""
+        app_context, app_state, ui_controller, sample_project = loaded_project
+        folder_id, new_name = "folder-123", "New Name"
         sample_project.find_item.return_value = sample_folder
         
-        # Make setting name raise an exception
-        def setter_with_exception(self, value):
-            raise Exception("Test error")
-        
-        type(sample_folder).name = property(lambda self: "Current", setter_with_exception)
-        
-        command = RenameFolderCommand(app_context, "folder-123", "New Name")
+        if scenario == "no_folder_id":
+            folder_id = None
+        elif scenario == "no_new_name":
+            new_name = None
+        elif scenario == "no_project":
+            app_state.has_project = False
+        elif scenario == "no_current_project":
+            app_state.current_project = None
+        elif scenario == "folder_not_found":
+            sample_project.find_item.return_value = None
+        elif scenario == "item_not_folder":
+            sample_project.find_item.return_value = Mock()
+        
+        command = RenameFolderCommand(app_context, folder_id, new_name)
         command.old_name = "Original Name"
         
         result = command.redo()
         
         assert result is False
-        ui_controller.show_error_message.assert_called_once()
-        assert "Failed to redo rename folder: Test error" in ui_controller.show_error_message.call_args[0][1]
+        assert sample_folder.name == "Original Folder"
+        app_state.event_bus.emit.assert_not_called()
 
     def test_clone_method(self, mock_app_context):
         """Test the clone method creates a new instance with same parameters."""
@@ -510,11 +409,9 @@ class TestRenameFolderCommand:
         command_none = RenameFolderCommand(app_context, "folder-123", None)
         assert str(command_none) == "Rename Folder to 'None'"
 
-    def test_name_storage_during_execute(self, mock_app_context, sample_project, sample_folder):
+    def test_name_storage_during_execute(self, loaded_project, sample_folder):
         """Test that old name is properly stored during execute."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_folder.name = "Initial Name"
         sample_project.find_item.return_value = sample_folder
@@ -530,11 +427,9 @@ class TestRenameFolderCommand:
         assert result is True
         assert command.old_name == "Initial Name"
 
-    def test_event_data_structure(self, mock_app_context, sample_project, sample_folder):
+    def test_event_data_structure(self, loaded_project, sample_folder):
         """Test that emitted events have correct data structure."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_folder.name = "Old Name"
         sample_project.find_item.return_value = sample_folder
@@ -542,28 +437,12 @@ class TestRenameFolderCommand:
         command = RenameFolderCommand(app_context, "test-folder", "New Name")
         command.execute()
         
-        # Check the event was emitted with correct structure
-        app_state.event_bus.emit.assert_called_once()
-        event_name, event_data = app_state.event_bus.emit.call_args[0]
-        
-        assert event_name == 'folder_renamed'
-        assert 'project' in event_data
-        assert 'folder_id' in event_data
-        assert 'old_name' in event_data
-        assert 'new_name' in event_data
-        assert 'folder' in event_data
-        
-        assert event_data['project'] == sample_project
-        assert event_data['folder_id'] == "test-folder"
-        assert event_data['old_name'] == "Old Name"
-        assert event_data['new_name'] == "New Name"
-        assert event_data['folder'] == sample_folder
+        _assert_rename_event(app_state.event_bus.emit, sample_project, "test-folder",
+                             "Old Name", "New Name", sample_folder)
 
-    def test_command_state_isolation(self, mock_app_context, sample_project):
+    def test_command_state_isolation(self, loaded_project):
         """Test that multiple command instances don't interfere with each other."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         folder1 = Mock(spec=Folder)
         folder1.name = "Folder 1"
@@ -1,4 +1,5 @@
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 from pandaplot.commands.project.item.delete_item_command import DeleteItemCommand
@@ -6,49 +7,86 @@ from pandaplot.models.project.items.note import Note
 from pandaplot.models.project.items.folder import Folder
 from pandaplot.models.project.project import Project
 from pandaplot.models.state.app_context import AppContext
-from pandaplot.models.state.app_state import AppState
 from pandaplot.gui.controllers.ui_controller import UIController
 
 
+@pytest.fixture(scope="session")
+def sample_note():
+    """Sample note shared by all tests; tests must not mutate it."""
+    return Note(id="note-123", name="Test Note", content="Test content")
+
+
+@pytest.fixture(scope="session")
+def sample_folder():
+    """Sample folder shared by all tests; tests must not mutate it."""
+    return Folder(id="folder-123", name="Test Folder")
+
+
+@pytest.fixture(scope="session")
+def sample_note_dict(sample_note):
+    """Serialized sample note, shared read-only by the undo/redo tests."""
+    return sample_note.to_dict()
+
+
 class TestDeleteItemCommand:
     """Test suite for DeleteItemCommand."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_app_context(self):
-        """Create mock app context with all dependencies."""
+        """Create mock app context with all dependencies once per module."""
         app_context = Mock(spec=AppContext)
-        app_state = Mock(spec=AppState)
+        # The command only reads plain attributes from the app state
+        app_state = SimpleNamespace(has_project=False, current_project=None, event_bus=Mock())
         ui_controller = Mock(spec=UIController)
         
         app_context.get_app_state.return_value = app_state
         app_context.get_ui_controller.return_value = ui_controller
         
-        # Setup event bus
-        app_state.event_bus = Mock()
-        app_state.event_bus.emit = Mock()
-        
         return app_context, app_state, ui_controller
     
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_app_context):
+        """Reset the shared mock app context before each test.
+        
+        The spec'd mocks are reset rather than copied: ``copy.copy`` of a Mock
+        shares its child mocks, so copies would record each other's calls.
+        """
+        app_context, app_state, ui_controller = mock_app_context
+        for mock in (app_context, ui_controller, app_state.event_bus):
+            mock.reset_mock(return_value=True, side_effect=True)
+        
+        app_context.get_app_state.return_value = app_state
+        app_context.get_ui_controller.return_value = ui_controller
+        app_state.has_project = False
+        app_state.current_project = None
+    
     @pytest.fixture
     def sample_project(self):
-        """Create a sample project for testing."""
-        project = Project("Test Project")
-        project.find_item = Mock()
-        project.remove_item = Mock()
-        project.add_item = Mock()
-        return project
+        """Create a mock project for testing."""
+        return Mock(spec=Project)
 
     @pytest.fixture
-    def sample_note(self):
-        """Create a sample note for testing."""
-        note = Note(id="note-123", name="Test Note", content="Test content")
-        return note
+    def loaded_project(self, mock_app_context, sample_project):
+        """Mock app context with sample_project loaded and deletions confirmed."""
+        app_context, app_state, ui_controller = mock_app_context
+        app_state.has_project = True
+        app_state.current_project = sample_project
+        ui_controller.show_question.return_value = True
+        return app_context, app_state, ui_controller, sample_project
 
     @pytest.fixture
-    def sample_folder(self):
-        """Create a sample folder for testing."""
-        folder = Folder(id="folder-123", name="Test Folder")
-        return folder
+    def make_deleted_command(self, mock_app_context, sample_note_dict):
+        """Factory for a DeleteItemCommand that looks like it already deleted an item."""
+        app_context, _, _ = mock_app_context
+        
+        def _make(item_id="note-123", cls=Note, data=None, parent=None):
+            command = DeleteItemCommand(app_context, item_id)
+            command.deleted_item_class = cls
+            command.deleted_item_data = data if data is not None else sample_note_dict
+            command.parent_item = parent
+            return command
+        
+        return _make
 
     def test_init_values(self, mock_app_context):
         """Test command initialization."""
@@ -64,55 +102,36 @@ class TestDeleteItemCommand:
         assert command.deleted_item_class is None
         assert command.parent_item is None
 
-    def test_execute_no_project_loaded(self, mock_app_context):
-        """Test execute when no project is loaded."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = False
-        
-        command = DeleteItemCommand(app_context, "item-123")
-        result = command.execute()
-        
-        assert result is False
-        ui_controller.show_warning_message.assert_called_once_with(
-            "Delete Item", 
-            "No project is currently loaded."
-        )
-
-    def test_execute_no_current_project(self, mock_app_context):
-        """Test execute when current project is None."""
+    @pytest.mark.parametrize("has_project,current_project,find_result,expected_warning", [
+        pytest.param(False, None, None, "No project is currently loaded.", id="no_project"),
+        pytest.param(True, None, None, None, id="no_current_project"),
+        pytest.param(True, "PROJECT", None, "Item 'item-123' not found in the project.",
+                     id="item_not_found"),
+    ])
+    def test_execute_failure_paths(self, mock_app_context, sample_project, has_project,
+                                   current_project, find_result, expected_warning):
+        """Test execute returns False when its preconditions are not met."""
         app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = None
-        
-        command = DeleteItemCommand(app_context, "item-123")
-        result = command.execute()
-        
-        assert result is False
-
-    def test_execute_item_not_found(self, mock_app_context, sample_project):
-        """Test execute when item is not found."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        # find_item returns None
-        sample_project.find_item.return_value = None
+        app_state.has_project = has_project
+        app_state.current_project = sample_project if current_project == "PROJECT" else None
+        sample_project.find_item.return_value = find_result
         
         command = DeleteItemCommand(app_context, "item-123")
         result = command.execute()
         
         assert result is False
-        sample_project.find_item.assert_called_once_with("item-123")
-        ui_controller.show_warning_message.assert_called_once_with(
-            "Delete Item", 
-            "Item 'item-123' not found in the project."
-        )
+        sample_project.remove_item.assert_not_called()
+        if expected_warning is None:
+            ui_controller.show_warning_message.assert_not_called()
+        else:
+            ui_controller.show_warning_message.assert_called_once_with(
+                "Delete Item",
+                expected_warning
+            )
 
-    def test_execute_user_cancels_deletion(self, mock_app_context, sample_project, sample_note):
+    def test_execute_user_cancels_deletion(self, loaded_project, sample_note):
         """Test execute when user cancels the deletion."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_note
         ui_controller.show_question.return_value = False  # User cancels
@@ -127,14 +146,11 @@ class TestDeleteItemCommand:
         )
         sample_project.remove_item.assert_not_called()
 
-    def test_execute_successful_note_deletion(self, mock_app_context, sample_project, sample_note):
+    def test_execute_successful_note_deletion(self, loaded_project, sample_note):
         """Test successful deletion of a note."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_note
-        ui_controller.show_question.return_value = True  # User confirms
         
         command = DeleteItemCommand(app_context, "note-123")
         result = command.execute()
@@ -157,14 +173,11 @@ class TestDeleteItemCommand:
             'item_data': command.deleted_item_data
         })
 
-    def test_execute_successful_folder_deletion(self, mock_app_context, sample_project, sample_folder):
+    def test_execute_successful_folder_deletion(self, loaded_project, sample_folder):
         """Test successful deletion of a folder."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_folder
-        ui_controller.show_question.return_value = True  # User confirms
         
         command = DeleteItemCommand(app_context, "folder-123")
         result = command.execute()
@@ -177,25 +190,19 @@ class TestDeleteItemCommand:
         
         sample_project.remove_item.assert_called_once_with(sample_folder)
 
-    def test_execute_with_parent_item(self, mock_app_context, sample_project, sample_note):
+    def test_execute_with_parent_item(self, loaded_project):
         """Test execute with item that has a parent."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
-        # Set up parent relationship
+        # Set up parent relationship on a note of our own; sample_note is shared
         parent_folder = Folder(id="parent-123", name="Parent Folder")
-        sample_note.parent_id = "parent-123"
+        note = Note(id="note-123", name="Test Note", content="Test content")
+        note.parent_id = "parent-123"
         
-        def find_item_side_effect(item_id):
-            if item_id == "note-123":
-                return sample_note
-            elif item_id == "parent-123":
-                return parent_folder
-            return None
-        
-        sample_project.find_item.side_effect = find_item_side_effect
-        ui_controller.show_question.return_value = True
+        sample_project.find_item.side_effect = {
+            "note-123": note,
+            "parent-123": parent_folder,
+        }.get
         
         command = DeleteItemCommand(app_context, "note-123")
         result = command.execute()
@@ -203,32 +210,36 @@ class TestDeleteItemCommand:
         assert result is True
         assert command.parent_item == parent_folder
 
-    def test_execute_with_exception(self, mock_app_context, sample_project, sample_note):
-        """Test execute when an exception occurs."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+    @pytest.mark.parametrize("method_name,failing_method,expected_prefix", [
+        ("execute", "remove_item", "Failed to delete item"),
+        ("undo", "add_item", "Failed to undo delete item"),
+        ("redo", "remove_item", "Failed to redo delete item"),
+    ])
+    def test_with_exception(self, loaded_project, sample_note, make_deleted_command,
+                            method_name, failing_method, expected_prefix):
+        """Test execute, undo and redo when an exception occurs."""
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_note
-        ui_controller.show_question.return_value = True
-        sample_project.remove_item.side_effect = Exception("Test error")
+        getattr(sample_project, failing_method).side_effect = Exception("Test error")
         
-        command = DeleteItemCommand(app_context, "note-123")
-        result = command.execute()
+        if method_name == "execute":
+            command = DeleteItemCommand(app_context, "note-123")
+        else:
+            command = make_deleted_command()
+        
+        result = getattr(command, method_name)()
         
         assert result is False
         ui_controller.show_error_message.assert_called_once()
-        assert "Failed to delete item: Test error" in ui_controller.show_error_message.call_args[0][1]
+        (_, message), _ = ui_controller.show_error_message.call_args
+        assert f"{expected_prefix}: Test error" in message
 
-    def test_undo_successful(self, mock_app_context, sample_project, sample_note):
+    def test_undo_successful(self, loaded_project, make_deleted_command):
         """Test successful undo operation."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
-        command = DeleteItemCommand(app_context, "note-123")
-        command.deleted_item_class = Note
-        command.deleted_item_data = sample_note.to_dict()
+        command = make_deleted_command()
         
         result = command.undo()
         
@@ -251,18 +262,13 @@ class TestDeleteItemCommand:
             'item': restored_item
         })
 
-    def test_undo_with_parent(self, mock_app_context, sample_project, sample_note):
+    def test_undo_with_parent(self, loaded_project, make_deleted_command):
         """Test undo with parent item."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         parent_folder = Folder(id="parent-123", name="Parent Folder")
         
-        command = DeleteItemCommand(app_context, "note-123")
-        command.deleted_item_class = Note
-        command.deleted_item_data = sample_note.to_dict()
-        command.parent_item = parent_folder
+        command = make_deleted_command(parent=parent_folder)
         
         result = command.undo()
         
@@ -273,58 +279,34 @@ class TestDeleteItemCommand:
         call_args = sample_project.add_item.call_args
         assert call_args[1]['parent_id'] == "parent-123"
 
-    def test_undo_no_deleted_data(self, mock_app_context):
-        """Test undo when no deleted data is stored."""
+    @pytest.mark.parametrize("has_deleted_data,has_project", [
+        pytest.param(False, True, id="no_deleted_data"),
+        pytest.param(True, False, id="no_project"),
+    ])
+    def test_undo_failure_paths(self, mock_app_context, sample_project, make_deleted_command,
+                                has_deleted_data, has_project):
+        """Test undo returns False when there is nothing to restore."""
         app_context, app_state, ui_controller = mock_app_context
-        
-        command = DeleteItemCommand(app_context, "item-123")
-        # deleted_item_data is None
-        result = command.undo()
-        
-        assert result is False
-
-    def test_undo_no_project(self, mock_app_context):
-        """Test undo when no project is loaded."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = False
-        
-        command = DeleteItemCommand(app_context, "item-123")
-        command.deleted_item_class = Note
-        command.deleted_item_data = {"id": "note-123", "name": "Test"}
-        
-        result = command.undo()
-        
-        assert result is False
-
-    def test_undo_with_exception(self, mock_app_context, sample_project, sample_note):
-        """Test undo when an exception occurs."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
+        app_state.has_project = has_project
         app_state.current_project = sample_project
         
-        sample_project.add_item.side_effect = Exception("Test error")
-        
-        command = DeleteItemCommand(app_context, "note-123")
-        command.deleted_item_class = Note
-        command.deleted_item_data = sample_note.to_dict()
+        if has_deleted_data:
+            command = make_deleted_command(data={"id": "note-123", "name": "Test"})
+        else:
+            command = DeleteItemCommand(app_context, "item-123")
         
         result = command.undo()
         
         assert result is False
-        ui_controller.show_error_message.assert_called_once()
-        assert "Failed to undo delete item: Test error" in ui_controller.show_error_message.call_args[0][1]
+        sample_project.add_item.assert_not_called()
 
-    def test_redo_successful(self, mock_app_context, sample_project, sample_note):
+    def test_redo_successful(self, loaded_project, sample_note, make_deleted_command):
         """Test successful redo operation."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_note
         
-        command = DeleteItemCommand(app_context, "note-123")
-        command.deleted_item_class = Note
-        command.deleted_item_data = sample_note.to_dict()
+        command = make_deleted_command()
         
         result = command.redo()
         
@@ -340,50 +322,25 @@ class TestDeleteItemCommand:
             'item_data': command.deleted_item_data
         })
 
-    def test_redo_no_deleted_data(self, mock_app_context):
-        """Test redo when no deleted data is stored."""
-        app_context, app_state, ui_controller = mock_app_context
-        
-        command = DeleteItemCommand(app_context, "item-123")
-        # deleted_item_data is None
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_item_not_found(self, mock_app_context, sample_project):
-        """Test redo when item is not found."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = None
-        
-        command = DeleteItemCommand(app_context, "note-123")
-        command.deleted_item_class = Note
-        command.deleted_item_data = {"id": "note-123", "name": "Test"}
+    @pytest.mark.parametrize("has_deleted_data,item_found", [
+        pytest.param(False, True, id="no_deleted_data"),
+        pytest.param(True, False, id="item_not_found"),
+    ])
+    def test_redo_failure_paths(self, loaded_project, sample_note,
+                                make_deleted_command, has_deleted_data, item_found):
+        """Test redo returns False when the item cannot be deleted again."""
+        app_context, app_state, ui_controller, sample_project = loaded_project
+        sample_project.find_item.return_value = sample_note if item_found else None
+        
+        if has_deleted_data:
+            command = make_deleted_command(data={"id": "note-123", "name": "Test"})
+        else:
+            command = DeleteItemCommand(app_context, "note-123")
         
         result = command.redo()
         
         assert result is False
-
-    def test_redo_with_exception(self, mock_app_context, sample_project, sample_note):
-        """Test redo when an exception occurs."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = sample_note
-        sample_project.remove_item.side_effect = Exception("Test error")
-        
-        command = DeleteItemCommand(app_context, "note-123")
-        command.deleted_item_class = Note
-        command.deleted_item_data = sample_note.to_dict()
-        
-        result = command.redo()
-        
-        assert result is False
-        ui_controller.show_error_message.assert_called_once()
-        assert "Failed to redo delete item: Test error" in ui_controller.show_error_message.call_args[0][1]
+        sample_project.remove_item.assert_not_called()
 
     def test_clone_method(self, mock_app_context):
         """Test the clone method creates a new instance with same parameters."""
@@ -416,81 +373,35 @@ class TestDeleteItemCommand:
         command.deleted_item_class = Note
         assert str(command) == "Delete note 'item-123'"
 
-    def test_different_item_types(self, mock_app_context, sample_project):
+    @pytest.mark.parametrize("item_class,item_id,item_name,expected_type", [
+        (Note, "note-1", "Test Note", "note"),
+        (Folder, "folder-1", "Test Folder", "folder"),
+    ], ids=["note", "folder"])
+    def test_different_item_types(self, loaded_project,
+                                  item_class, item_id, item_name, expected_type):
         """Test deletion of different item types."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        ui_controller.show_question.return_value = True
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
-        # Test different item types
-        test_cases = [
-            (Note(id="note-1", name="Test Note"), "note"),
-            (Folder(id="folder-1", name="Test Folder"), "folder"),
-        ]
-        
-        for item, expected_type in test_cases:
-            sample_project.find_item.return_value = item
-            sample_project.remove_item.reset_mock()
-            app_state.event_bus.emit.reset_mock()
-            
-            command = DeleteItemCommand(app_context, item.id)
-            result = command.execute()
-            
-            assert result is True
-            assert command.deleted_item_class is type(item)
-            sample_project.remove_item.assert_called_once_with(item)
-            
-            # Check event emission
-            event_call = app_state.event_bus.emit.call_args
-            assert event_call[0][0] == 'item_deleted'
-            assert event_call[0][1]['item_type'] == expected_type
-
-    def test_serialization_round_trip(self, mock_app_context, sample_project):
-        """Test that items can be properly serialized and deserialized."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        item = item_class(id=item_id, name=item_name)
+        sample_project.find_item.return_value = item
         
-        # Create a note with complex data
-        original_note = Note(
-            id="complex-note",
-            name="Complex Note",
-            content="This is complex content with\nmultiple lines",
-            tags=["tag1", "tag2"]
-        )
-        original_note.parent_id = "parent-123"
-        original_note.metadata = {"custom": "data", "number": 42}
-        
-        command = DeleteItemCommand(app_context, "complex-note")
-        command.deleted_item_class = Note
-        command.deleted_item_data = original_note.to_dict()
-        
-        # Simulate undo to recreate the item
-        result = command.undo()
+        command = DeleteItemCommand(app_context, item.id)
+        result = command.execute()
         
         assert result is True
+        assert command.deleted_item_class is item_class
+        sample_project.remove_item.assert_called_once_with(item)
         
-        # Verify the recreated item matches the original
-        sample_project.add_item.assert_called_once()
-        recreated_item = sample_project.add_item.call_args[0][0]
-        
-        assert isinstance(recreated_item, Note)
-        assert recreated_item.id == original_note.id
-        assert recreated_item.name == original_note.name
-        assert recreated_item.content == original_note.content
-        assert recreated_item.tags == original_note.tags
-        assert recreated_item.parent_id == original_note.parent_id
-        assert recreated_item.metadata == original_note.metadata
+        # Check event emission
+        event_name, event_data = app_state.event_bus.emit.call_args[0]
+        assert event_name == 'item_deleted'
+        assert event_data['item_type'] == expected_type
 
-    def test_event_data_structure(self, mock_app_context, sample_project, sample_note):
+    def test_event_data_structure(self, loaded_project, sample_note):
         """Test that emitted events have correct data structure."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         sample_project.find_item.return_value = sample_note
-        ui_controller.show_question.return_value = True
         
         command = DeleteItemCommand(app_context, "note-123")
         command.execute()
@@ -512,24 +423,14 @@ class TestDeleteItemCommand:
         assert event_data['item_name'] == "Test Note"
         assert event_data['item_data'] == command.deleted_item_data
 
-    def test_command_state_isolation(self, mock_app_context, sample_project):
+    def test_command_state_isolation(self, loaded_project):
         """Test that multiple command instances don't interfere with each other."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        ui_controller.show_question.return_value = True
+        app_context, app_state, ui_controller, sample_project = loaded_project
         
         note1 = Note(id="note-1", name="Note 1")
         note2 = Note(id="note-2", name="Note 2")
         
-        def find_item_side_effect(item_id):
-            if item_id == "note-1":
-                return note1
-            elif item_id == "note-2":
-                return note2
-            return None
-        
-        sample_project.find_item.side_effect = find_item_side_effect
+        sample_project.find_item.side_effect = {"note-1": note1, "note-2": note2}.get
         
         command1 = DeleteItemCommand(app_context, "note-1")
         command2 = DeleteItemCommand(app_context, "note-2")
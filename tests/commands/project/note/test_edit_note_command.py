@@ -2,46 +2,33 @@ import pytest
 from unittest.mock import Mock
 
 from pandaplot.commands.project.note.edit_note_command import EditNoteCommand
+from pandaplot.models.events.event_bus import EventBus
 from pandaplot.models.project.items.note import Note
 from pandaplot.models.project.project import Project
-from pandaplot.models.state.app_context import AppContext
-from pandaplot.models.state.app_state import AppState
-from pandaplot.gui.controllers.ui_controller import UIController
+
+
+def _make_note(note_id, content):
+    """Create a real Note whose update_content is recorded but does nothing."""
+    note = Note(id=note_id, content=content)
+    note.update_content = Mock()
+    return note
+
+
+def _make_command(app_context, op):
+    """Create an EditNoteCommand in the state ``op`` expects; undo/redo need a prior execute."""
+    command = EditNoteCommand(app_context, "note-123", "New content")
+    if op != "execute":
+        command.old_content = "Original content"
+    return command
 
 
 class TestEditNoteCommand:
     """Test suite for EditNoteCommand."""
     
-    @pytest.fixture
-    def mock_app_context(self):
-        """Create mock app context with all dependencies."""
-        app_context = Mock(spec=AppContext)
-        app_state = Mock(spec=AppState)
-        ui_controller = Mock(spec=UIController)
-        
-        app_context.get_app_state.return_value = app_state
-        app_context.get_ui_controller.return_value = ui_controller
-        
-        # Setup event bus
-        app_state.event_bus = Mock()
-        app_state.event_bus.emit = Mock()
-        
-        return app_context, app_state, ui_controller
-    
-    @pytest.fixture
-    def sample_project(self):
-        """Create a sample project for testing."""
-        project = Project("Test Project")
-        project.find_item = Mock()
-        return project
-
     @pytest.fixture
     def sample_note(self):
         """Create a sample note for testing."""
-        note = Mock(spec=Note)
-        note.content = "Original content"
-        note.update_content = Mock()
-        return note
+        return _make_note("note-123", "Original content")
 
     def test_init_values(self, mock_app_context):
         """Test command initialization."""
@@ -70,80 +57,61 @@ class TestEditNoteCommand:
             "No project is currently loaded."
         )
 
-    def test_execute_no_current_project(self, mock_app_context):
-        """Test execute when current project is None."""
+    @pytest.mark.parametrize("op,warning", [
+        pytest.param("execute", None, id="execute"),
+        pytest.param("undo", ("Undo Edit Note", "No project is currently loaded."), id="undo"),
+        pytest.param("redo", None, id="redo"),
+    ])
+    def test_no_current_project(self, mock_app_context, op, warning):
+        """Test each operation when current project is None."""
         app_context, app_state, ui_controller = mock_app_context
         app_state.has_project = True
         app_state.current_project = None
         
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        result = command.execute()
+        command = _make_command(app_context, op)
+        result = getattr(command, op)()
         
         assert result is False
+        if warning is None:
+            ui_controller.show_warning_message.assert_not_called()
+        else:
+            ui_controller.show_warning_message.assert_called_once_with(*warning)
 
-    def test_execute_note_not_found(self, mock_app_context, sample_project):
-        """Test execute when note is not found."""
+    @pytest.mark.parametrize("found_item", [
+        pytest.param(None, id="not_found"),
+        pytest.param(object(), id="item_not_note"),
+    ])
+    @pytest.mark.parametrize("op,warning", [
+        pytest.param("execute", ("Edit Note", "Note 'note-123' not found in the project."), id="execute"),
+        pytest.param("undo", ("Undo Edit Note", "Note with ID 'note-123' not found in the project."), id="undo"),
+        pytest.param("redo", None, id="redo"),
+    ])
+    def test_note_not_found(self, mock_app_context, sample_project, op, warning, found_item):
+        """Test each operation when the note is missing or the item is not a Note."""
         app_context, app_state, ui_controller = mock_app_context
         app_state.has_project = True
         app_state.current_project = sample_project
         
-        # find_item returns None
-        sample_project.find_item.return_value = None
+        sample_project.find_item.return_value = found_item
         
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        result = command.execute()
+        command = _make_command(app_context, op)
+        result = getattr(command, op)()
         
         assert result is False
         sample_project.find_item.assert_called_once_with("note-123")
-        ui_controller.show_warning_message.assert_called_once_with(
-            "Edit Note", 
-            "Note 'note-123' not found in the project."
-        )
+        app_state.event_bus.emit.assert_not_called()
+        if warning is None:
+            ui_controller.show_warning_message.assert_not_called()
+        else:
+            ui_controller.show_warning_message.assert_called_once_with(*warning)
 
-    def test_execute_item_not_note(self, mock_app_context, sample_project):
-        """Test execute when found item is not a Note."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        # find_item returns a non-Note object
-        not_a_note = Mock()
-        sample_project.find_item.return_value = not_a_note
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        result = command.execute()
-        
-        assert result is False
-        ui_controller.show_warning_message.assert_called_once_with(
-            "Edit Note", 
-            "Note 'note-123' not found in the project."
-        )
-
-    def test_execute_successful(self, mock_app_context, sample_project, sample_note):
-        """Test successful execute operation."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = sample_note
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        result = command.execute()
-        
-        assert result is True
-        assert command.old_content == "Original content"
-        sample_note.update_content.assert_called_once_with("New content")
-        
-        # Check event emission
-        app_state.event_bus.emit.assert_called_once_with('note_edited', {
-            'project': sample_project,
-            'note_id': "note-123",
-            'old_content': "Original content",
-            'new_content': "New content"
-        })
-
-    def test_execute_with_exception(self, mock_app_context, sample_project, sample_note):
-        """Test execute when an exception occurs."""
+    @pytest.mark.parametrize("op,title,message", [
+        pytest.param("execute", "Edit Note Error", "Failed to edit note: Test error", id="execute"),
+        pytest.param("undo", "Undo Error", "Failed to undo edit note: Test error", id="undo"),
+        pytest.param("redo", "Redo Error", "Failed to redo edit note: Test error", id="redo"),
+    ])
+    def test_with_exception(self, mock_app_context, sample_project, sample_note, op, title, message):
+        """Test each operation when an exception occurs."""
         app_context, app_state, ui_controller = mock_app_context
         app_state.has_project = True
         app_state.current_project = sample_project
@@ -151,35 +119,36 @@ class TestEditNoteCommand:
         sample_project.find_item.return_value = sample_note
         sample_note.update_content.side_effect = Exception("Test error")
         
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        result = command.execute()
+        command = _make_command(app_context, op)
+        result = getattr(command, op)()
         
         assert result is False
-        ui_controller.show_error_message.assert_called_once()
-        assert "Failed to edit note: Test error" in ui_controller.show_error_message.call_args[0][1]
+        ui_controller.show_error_message.assert_called_once_with(title, message)
 
-    def test_undo_successful(self, mock_app_context, sample_project, sample_note):
-        """Test successful undo operation."""
+    @pytest.mark.parametrize("op,applied,old,new", [
+        pytest.param("execute", "New content", "Original content", "New content", id="execute"),
+        pytest.param("undo", "Original content", "New content", "Original content", id="undo"),
+        pytest.param("redo", "New content", "Original content", "New content", id="redo"),
+    ])
+    def test_successful(self, mock_app_context, sample_project, sample_note, op, applied, old, new):
+        """Test each operation applies the content and emits 'note_edited'."""
         app_context, app_state, ui_controller = mock_app_context
         app_state.has_project = True
         app_state.current_project = sample_project
         
         sample_project.find_item.return_value = sample_note
         
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"  # Simulate execute was called
-        
-        result = command.undo()
+        command = _make_command(app_context, op)
+        result = getattr(command, op)()
         
         assert result is True
-        sample_note.update_content.assert_called_once_with("Original content")
-        
-        # Check event emission
+        assert command.old_content == "Original content"
+        sample_note.update_content.assert_called_once_with(applied)
         app_state.event_bus.emit.assert_called_once_with('note_edited', {
             'project': sample_project,
             'note_id': "note-123",
-            'old_content': "New content",
-            'new_content': "Original content"
+            'old_content': old,
+            'new_content': new
         })
 
     def test_undo_no_old_content(self, mock_app_context):
@@ -206,104 +175,6 @@ class TestEditNoteCommand:
         # Should not crash and should not perform any operations
         assert result is None
 
-    def test_undo_no_current_project(self, mock_app_context):
-        """Test undo when current project is None."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = None
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"
-        
-        result = command.undo()
-        
-        assert result is False
-        ui_controller.show_warning_message.assert_called_once_with(
-            "Undo Edit Note", 
-            "No project is currently loaded."
-        )
-
-    def test_undo_note_not_found(self, mock_app_context, sample_project):
-        """Test undo when note is not found."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = None
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"
-        
-        result = command.undo()
-        
-        assert result is False
-        ui_controller.show_warning_message.assert_called_once_with(
-            "Undo Edit Note", 
-            "Note with ID 'note-123' not found in the project."
-        )
-
-    def test_undo_item_not_note(self, mock_app_context, sample_project):
-        """Test undo when found item is not a Note."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        not_a_note = Mock()
-        sample_project.find_item.return_value = not_a_note
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"
-        
-        result = command.undo()
-        
-        assert result is False
-        ui_controller.show_warning_message.assert_called_once_with(
-            "Undo Edit Note", 
-            "Note with ID 'note-123' not found in the project."
-        )
-
-    def test_undo_with_exception(self, mock_app_context, sample_project, sample_note):
-        """Test undo when an exception occurs."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = sample_note
-        sample_note.update_content.side_effect = Exception("Test error")
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"
-        
-        result = command.undo()
-        
-        assert result is False
-        ui_controller.show_error_message.assert_called_once()
-        assert "Failed to undo edit note: Test error" in ui_controller.show_error_message.call_args[0][1]
-
-    def test_redo_successful(self, mock_app_context, sample_project, sample_note):
-        """Test successful redo operation."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = sample_note
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"  # Simulate execute was called
-        
-        result = command.redo()
-        
-        assert result is True
-        sample_note.update_content.assert_called_once_with("New content")
-        
-        # Check event emission
-        app_state.event_bus.emit.assert_called_once_with('note_edited', {
-            'project': sample_project,
-            'note_id': "note-123",
-            'old_content': "Original content",
-            'new_content': "New content"
-        })
-
     def test_redo_no_old_content(self, mock_app_context):
         """Test redo when no old content is stored."""
         app_context, app_state, ui_controller = mock_app_context
@@ -326,68 +197,6 @@ class TestEditNoteCommand:
         
         assert result is False
 
-    def test_redo_no_current_project(self, mock_app_context):
-        """Test redo when current project is None."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = None
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_note_not_found(self, mock_app_context, sample_project):
-        """Test redo when note is not found."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = None
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_item_not_note(self, mock_app_context, sample_project):
-        """Test redo when found item is not a Note."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        not_a_note = Mock()
-        sample_project.find_item.return_value = not_a_note
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"
-        
-        result = command.redo()
-        
-        assert result is False
-
-    def test_redo_with_exception(self, mock_app_context, sample_project, sample_note):
-        """Test redo when an exception occurs."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_project.find_item.return_value = sample_note
-        sample_note.update_content.side_effect = Exception("Test error")
-        
-        command = EditNoteCommand(app_context, "note-123", "New content")
-        command.old_content = "Original content"
-        
-        result = command.redo()
-        
-        assert result is False
-        ui_controller.show_error_message.assert_called_once()
-        assert "Failed to redo edit note: Test error" in ui_controller.show_error_message.call_args[0][1]
-
     def test_clone_method(self, mock_app_context):
         """Test the clone method creates a new instance with same parameters."""
         app_context, app_state, ui_controller = mock_app_context
@@ -433,31 +242,6 @@ class TestEditNoteCommand:
         assert result is True
         assert command.old_content == "Initial content"
 
-    def test_multiple_executions_preserve_original_content(self, mock_app_context, sample_project, sample_note):
-        """Test that multiple executions don't overwrite the original content."""
-        app_context, app_state, ui_controller = mock_app_context
-        app_state.has_project = True
-        app_state.current_project = sample_project
-        
-        sample_note.content = "Original content"
-        sample_project.find_item.return_value = sample_note
-        
-        command = EditNoteCommand(app_context, "note-123", "First edit")
-        
-        # First execution
-        command.execute()
-        assert command.old_content == "Original content"
-        
-        # Simulate the note content changing
-        sample_note.content = "First edit"
-        
-        # Second execution should not overwrite old_content if it's already set
-        command2 = EditNoteCommand(app_context, "note-123", "Second edit")
-        command2.old_content = "Original content"  # Simulate it was already set
-        
-        # This would be handled by the application logic, not the command itself
-        # The test demonstrates the expected behavior
-
     def test_event_data_structure(self, mock_app_context, sample_project, sample_note):
         """Test that emitted events have correct data structure."""
         app_context, app_state, ui_controller = mock_app_context
@@ -491,13 +275,8 @@ class TestEditNoteCommand:
         app_state.has_project = True
         app_state.current_project = sample_project
         
-        note1 = Mock(spec=Note)
-        note1.content = "Content 1"
-        note1.update_content = Mock()
-        
-        note2 = Mock(spec=Note)
-        note2.content = "Content 2"
-        note2.update_content = Mock()
+        note1 = _make_note("note-1", "Content 1")
+        note2 = _make_note("note-2", "Content 2")
         
         def find_item_side_effect(note_id):
             if note_id == "note-1":
@@ -520,3 +299,31 @@ class TestEditNoteCommand:
         assert command2.note_id == "note-2"
         assert command1.new_content == "New content 1"
         assert command2.new_content == "New content 2"
+
+
+class TestEditNoteCommandBenchmark:
+    """Benchmarks for the EditNoteCommand hot path.
+    
+    Run with ``pytest --benchmark-enable --benchmark-only``; otherwise each
+    benchmark executes once as a plain test.
+    """
+    
+    @pytest.fixture
+    def real_project_with_note(self, mock_app_context):
+        """Load a real Project holding one note, with a real EventBus."""
+        app_context, app_state, ui_controller = mock_app_context
+        project = Project("Benchmark Project")
+        project.add_item(Note(id="note-123", content="Original content"))
+        
+        app_state.has_project = True
+        app_state.current_project = project
+        app_state.event_bus = EventBus()
+        return app_context, project
+
+    def test_execute_benchmark(self, benchmark, real_project_with_note):
+        """Benchmark execute: find the note, update it and emit 'note_edited'."""
+        app_context, project = real_project_with_note
+        command = EditNoteCommand(app_context, "note-123", "Edited content")
+        
+        assert benchmark(command.execute) is True
+        assert project.find_item("note-123").content == "Edited content"
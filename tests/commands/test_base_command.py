@@ -16,15 +16,7 @@ class TestCommand:
     
     def test_command_has_required_abstract_methods(self):
         """Test that Command defines the required abstract methods."""
-        # Check that abstract methods are defined
-        assert hasattr(Command, 'execute')
-        assert hasattr(Command, 'undo')
-        assert hasattr(Command, 'redo')
-        
-        # Check that they are abstract methods
-        assert Command.execute.__isabstractmethod__
-        assert Command.undo.__isabstractmethod__
-        assert Command.redo.__isabstractmethod__
+        assert Command.__abstractmethods__ == {'execute', 'undo', 'redo'}
     
     def test_command_repr_method(self):
         """Test that Command has a __repr__ method."""
@@ -157,64 +149,26 @@ class TestConcreteCommand:
         cmd = ConcreteCommand("TestRepr")
         expected = "ConcreteCommand(name='TestRepr')"
         assert repr(cmd) == expected
-    
-    def test_command_default_repr(self):
-        """Test the default __repr__ method from base Command."""
-        cmd = ConcreteCommand()
-        # Should use the base class __repr__ if not overridden
-        # But our ConcreteCommand does override it
-        assert "ConcreteCommand" in repr(cmd)
-    
-    def test_inheritance_hierarchy(self):
-        """Test that concrete commands properly inherit from Command."""
-        cmd = ConcreteCommand()
-        
-        assert isinstance(cmd, Command)
-        assert isinstance(cmd, ABC)
-        assert issubclass(ConcreteCommand, Command)
-        assert issubclass(ConcreteCommand, ABC)
 
 
 class TestCommandWithExceptions:
     """Test cases for commands that raise exceptions."""
     
-    def test_failing_execute_command(self):
-        """Test command that fails during execute."""
-        cmd = FailingCommand("execute")
-        
-        with pytest.raises(RuntimeError, match="Execute failed"):
-            cmd.execute()
-    
-    def test_failing_undo_command(self):
-        """Test command that fails during undo."""
-        cmd = FailingCommand("undo")
-        
-        with pytest.raises(RuntimeError, match="Undo failed"):
-            cmd.undo()
-    
-    def test_failing_redo_command(self):
-        """Test command that fails during redo."""
-        cmd = FailingCommand("redo")
-        
-        with pytest.raises(RuntimeError, match="Redo failed"):
-            cmd.redo()
-    
-    def test_partial_failure_scenarios(self):
-        """Test commands that fail only on specific operations."""
-        # Command that only fails on undo
-        cmd1 = FailingCommand("undo")
-        cmd1.execute()  # Should succeed
-        
-        with pytest.raises(RuntimeError):
-            cmd1.undo()
-        
-        # Command that only fails on redo
-        cmd2 = FailingCommand("redo")
-        cmd2.execute()  # Should succeed
-        cmd2.undo()     # Should succeed
-        
-        with pytest.raises(RuntimeError):
-            cmd2.redo()
+    @pytest.mark.parametrize("op,msg", [
+        pytest.param("execute", "Execute failed", id="execute"),
+        pytest.param("undo", "Undo failed", id="undo"),
+        pytest.param("redo", "Redo failed", id="redo"),
+    ])
+    def test_failing_command(self, op, msg):
+        """Test command that fails only during the given operation."""
+        cmd = FailingCommand(op)
+        
+        for other in ("execute", "undo", "redo"):
+            if other != op:
+                getattr(cmd, other)()  # Should succeed
+        
+        with pytest.raises(RuntimeError, match=msg):
+            getattr(cmd, op)()
 
 
 class TestCommandEdgeCases:
@@ -1,21 +1,25 @@
-from unittest.mock import patch
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pytest
 from pandaplot.commands.command_executor import CommandExecutor
 from pandaplot.commands.base_command import Command
 
 
+@dataclass(slots=True, eq=False, repr=False)
 class MockCommand(Command):
     """Mock command for testing."""
     
-    def __init__(self, name="MockCommand", should_fail=False, fail_on=None):
-        self.name = name
-        self.should_fail = should_fail
-        self.fail_on = fail_on
-        self.executed = False
-        self.undone = False
-        self.redone = False
-        self.execute_count = 0
-        self.undo_count = 0
-        self.redo_count = 0
+    name: str = "MockCommand"
+    should_fail: bool = False
+    fail_on: Optional[str] = None
+    executed: bool = field(default=False, init=False)
+    undone: bool = field(default=False, init=False)
+    redone: bool = field(default=False, init=False)
+    execute_count: int = field(default=0, init=False)
+    undo_count: int = field(default=0, init=False)
+    redo_count: int = field(default=0, init=False)
     
     def execute(self):
         if self.should_fail and self.fail_on == "execute":
@@ -39,6 +43,12 @@ class MockCommand(Command):
         return f"{self.__class__.__name__}(name='{self.name}')"
 
 
+@pytest.fixture
+def cmds():
+    """Five fresh commands named Command1..Command5."""
+    return [MockCommand(f"Command{i}") for i in range(1, 6)]
+
+
 class TestCommandExecutor:
     """Test cases for CommandExecutor initialization and basic properties."""
     
@@ -46,11 +56,12 @@ class TestCommandExecutor:
         """Test CommandExecutor initialization with default values."""
         executor = CommandExecutor()
         
-        assert isinstance(executor.undo_stack, list)
+        assert isinstance(executor.undo_stack, deque)
         assert isinstance(executor.redo_stack, list)
         assert len(executor.undo_stack) == 0
         assert len(executor.redo_stack) == 0
         assert executor.max_undo_levels == 10
+        assert executor.undo_stack.maxlen == 10
     
     def test_executor_initial_state(self):
         """Test initial state of CommandExecutor."""
@@ -79,42 +90,34 @@ class TestCommandExecution:
         assert executor.undo_stack[0] is command
         assert len(executor.redo_stack) == 0
     
-    def test_execute_command_failure(self):
+    def test_execute_command_failure(self, capsys):
         """Test command execution that fails."""
         executor = CommandExecutor()
         command = MockCommand("FailingCommand", should_fail=True, fail_on="execute")
         
-        with patch('builtins.print') as mock_print:
-            result = executor.execute_command(command)
+        result = executor.execute_command(command)
         
         assert result is False
         assert not command.executed
         assert len(executor.undo_stack) == 0
         assert len(executor.redo_stack) == 0
-        mock_print.assert_called_once_with("Error executing command 'MockCommand': FailingCommand execute failed")
+        assert capsys.readouterr().out == "Error executing command 'MockCommand': FailingCommand execute failed\n"
     
-    def test_execute_multiple_commands(self):
+    @pytest.mark.parametrize("n_cmds", [1, 3, 5])
+    def test_execute_multiple_commands(self, cmds, n_cmds):
         """Test executing multiple commands."""
         executor = CommandExecutor()
-        cmd1 = MockCommand("Command1")
-        cmd2 = MockCommand("Command2")
-        cmd3 = MockCommand("Command3")
         
-        executor.execute_command(cmd1)
-        executor.execute_command(cmd2)
-        executor.execute_command(cmd3)
+        results = [executor.execute_command(cmd) for cmd in cmds[:n_cmds]]
         
-        assert len(executor.undo_stack) == 3
-        assert executor.undo_stack[0] is cmd1
-        assert executor.undo_stack[1] is cmd2
-        assert executor.undo_stack[2] is cmd3
+        assert all(results)
+        assert list(executor.undo_stack) == cmds[:n_cmds]
         assert len(executor.redo_stack) == 0
     
-    def test_execute_command_clears_redo_stack(self):
+    def test_execute_command_clears_redo_stack(self, cmds):
         """Test that executing a new command clears the redo stack."""
         executor = CommandExecutor()
-        cmd1 = MockCommand("Command1")
-        cmd2 = MockCommand("Command2")
+        cmd1, cmd2 = cmds[:2]
         
         # Execute and undo command to populate redo stack
         executor.execute_command(cmd1)
@@ -156,44 +159,20 @@ class TestUndoFunctionality:
         assert len(executor.undo_stack) == 0
         assert len(executor.redo_stack) == 0
     
-    def test_undo_failure(self):
+    def test_undo_failure(self, capsys):
         """Test undo operation that fails."""
         executor = CommandExecutor()
         command = MockCommand("FailingCommand", should_fail=True, fail_on="undo")
         
         executor.execute_command(command)
         
-        with patch('builtins.print') as mock_print:
-            result = executor.undo()
+        result = executor.undo()
         
         assert result is False
         # Command should be removed from undo stack even if undo fails
         assert len(executor.undo_stack) == 0
         assert len(executor.redo_stack) == 0
-        mock_print.assert_called_once_with("Error undoing command: FailingCommand undo failed")
-    
-    def test_multiple_undo_operations(self):
-        """Test multiple undo operations."""
-        executor = CommandExecutor()
-        cmd1 = MockCommand("Command1")
-        cmd2 = MockCommand("Command2")
-        cmd3 = MockCommand("Command3")
-        
-        executor.execute_command(cmd1)
-        executor.execute_command(cmd2)
-        executor.execute_command(cmd3)
-        
-        # Undo all commands
-        result1 = executor.undo()  # Undo cmd3
-        result2 = executor.undo()  # Undo cmd2
-        result3 = executor.undo()  # Undo cmd1
-        
-        assert all([result1, result2, result3])
-        assert len(executor.undo_stack) == 0
-        assert len(executor.redo_stack) == 3
-        assert executor.redo_stack[0] is cmd3
-        assert executor.redo_stack[1] is cmd2
-        assert executor.redo_stack[2] is cmd1
+        assert capsys.readouterr().out == "Error undoing command: FailingCommand undo failed\n"
 
 
 class TestRedoFunctionality:
@@ -225,7 +204,7 @@ class TestRedoFunctionality:
         assert len(executor.undo_stack) == 0
         assert len(executor.redo_stack) == 0
     
-    def test_redo_failure(self):
+    def test_redo_failure(self, capsys):
         """Test redo operation that fails."""
         executor = CommandExecutor()
         command = MockCommand("FailingCommand", should_fail=True, fail_on="redo")
@@ -233,41 +212,44 @@ class TestRedoFunctionality:
         executor.execute_command(command)
         executor.undo()
         
-        with patch('builtins.print') as mock_print:
-            result = executor.redo()
+        result = executor.redo()
         
         assert result is False
         # Command should be removed from redo stack even if redo fails
         assert len(executor.undo_stack) == 0
         assert len(executor.redo_stack) == 0
-        mock_print.assert_called_once_with("Error redoing command: FailingCommand redo failed")
-    
-    def test_multiple_redo_operations(self):
-        """Test multiple redo operations."""
+        assert capsys.readouterr().out == "Error redoing command: FailingCommand redo failed\n"
+
+
+class TestOperationSequences:
+    """Table-driven tests for sequences of execute (E), undo (U) and redo (R)."""
+    
+    @pytest.mark.parametrize("ops,expected_undo,expected_redo", [
+        pytest.param("EEEUUU", [], ["Command3", "Command2", "Command1"], id="undo_all"),
+        pytest.param("EEEUUURRR", ["Command1", "Command2", "Command3"], [], id="redo_all"),
+        pytest.param("EEUR", ["Command1", "Command2"], [], id="undo_redo_last"),
+        pytest.param("EUREU", ["Command1"], ["Command2"], id="interleaved"),
+        pytest.param("EEUE", ["Command1", "Command3"], [], id="execute_clears_redo"),
+    ])
+    def test_operation_sequence(self, cmds, ops, expected_undo, expected_redo):
+        """Test that every operation succeeds and leaves the expected stacks."""
         executor = CommandExecutor()
-        cmd1 = MockCommand("Command1")
-        cmd2 = MockCommand("Command2")
-        cmd3 = MockCommand("Command3")
+        pending = iter(cmds)
         
-        # Execute and undo all commands
-        executor.execute_command(cmd1)
-        executor.execute_command(cmd2)
-        executor.execute_command(cmd3)
-        executor.undo()
-        executor.undo()
-        executor.undo()
+        def execute_next():
+            return executor.execute_command(next(pending))
         
-        # Redo all commands
-        result1 = executor.redo()  # Redo cmd1
-        result2 = executor.redo()  # Redo cmd2
-        result3 = executor.redo()  # Redo cmd3
+        operations = {
+            "E": execute_next,
+            "U": executor.undo,
+            "R": executor.redo,
+        }
         
-        assert all([result1, result2, result3])
-        assert len(executor.undo_stack) == 3
-        assert len(executor.redo_stack) == 0
-        assert executor.undo_stack[0] is cmd1
-        assert executor.undo_stack[1] is cmd2
-        assert executor.undo_stack[2] is cmd3
+        for op in ops:
+            assert operations[op]() is True
+        
+        assert [cmd.name for cmd in executor.undo_stack] == expected_undo
+        assert [cmd.name for cmd in executor.redo_stack] == expected_redo
 
 
 class TestCanUndoRedo:
@@ -302,11 +284,10 @@ class TestCanUndoRedo:
         executor.redo()
         assert not executor.can_redo()
     
-    def test_can_undo_redo_state_consistency(self):
+    def test_can_undo_redo_state_consistency(self, cmds):
         """Test that can_undo and can_redo reflect actual stack states."""
         executor = CommandExecutor()
-        cmd1 = MockCommand("Command1")
-        cmd2 = MockCommand("Command2")
+        cmd1, cmd2 = cmds[:2]
         
         # Initial state
         assert not executor.can_undo()
@@ -367,12 +348,10 @@ class TestDescriptionMethods:
         executor.redo()
         assert executor.get_redo_description() is None
     
-    def test_description_methods_with_multiple_commands(self):
+    def test_description_methods_with_multiple_commands(self, cmds):
         """Test description methods with multiple commands."""
         executor = CommandExecutor()
-        cmd1 = MockCommand("Command1")
-        cmd2 = MockCommand("Command2")
-        cmd3 = MockCommand("Command3")
+        cmd1, cmd2, cmd3 = cmds[:3]
         
         executor.execute_command(cmd1)
         executor.execute_command(cmd2)
@@ -393,21 +372,20 @@ class TestDescriptionMethods:
 class TestMaxUndoLevels:
     """Test cases for max undo levels functionality."""
     
-    def test_max_undo_levels_enforcement(self):
+    def test_max_undo_levels_enforcement(self, cmds):
         """Test that max undo levels are enforced."""
         executor = CommandExecutor()
         executor.max_undo_levels = 3
         
         # Execute more commands than max levels
-        commands = [MockCommand(f"Command{i}") for i in range(5)]
-        for cmd in commands:
+        for cmd in cmds:
             executor.execute_command(cmd)
         
         # Should only keep last 3 commands
         assert len(executor.undo_stack) == 3
-        assert executor.undo_stack[0] is commands[2]  # Command2
-        assert executor.undo_stack[1] is commands[3]  # Command3
-        assert executor.undo_stack[2] is commands[4]  # Command4
+        assert executor.undo_stack[0] is cmds[2]  # Command3
+        assert executor.undo_stack[1] is cmds[3]  # Command4
+        assert executor.undo_stack[2] is cmds[4]  # Command5
     
     def test_max_undo_levels_zero(self):
         """Test behavior when max undo levels is 0."""
@@ -421,13 +399,12 @@ class TestMaxUndoLevels:
         assert len(executor.undo_stack) == 0
         assert not executor.can_undo()
     
-    def test_max_undo_levels_modification(self):
+    def test_max_undo_levels_modification(self, cmds):
         """Test behavior when max undo levels is modified after commands."""
         executor = CommandExecutor()
         
         # Add some commands within normal max_undo_levels
-        commands = [MockCommand(f"Command{i}") for i in range(3)]
-        for cmd in commands:
+        for cmd in cmds[:3]:
             executor.execute_command(cmd)
         
         assert len(executor.undo_stack) == 3
@@ -435,35 +412,31 @@ class TestMaxUndoLevels:
         # Modify max levels to be lower
         executor.max_undo_levels = 2
         
-        # The existing stack is not automatically trimmed
-        assert len(executor.undo_stack) == 3
+        # The existing stack is trimmed to the newest commands right away
+        assert executor.undo_stack.maxlen == 2
+        assert list(executor.undo_stack) == cmds[1:3]
         
-        # Add a new command - this will add to stack (4 total) then remove 1 (3 remaining)
-        # The trimming logic only removes one element when size > max_undo_levels
+        # New commands keep evicting the oldest one
         new_cmd = MockCommand("NewCommand")
         executor.execute_command(new_cmd)
         
-        # Stack size should still be 3 (added 1, removed 1)
-        assert len(executor.undo_stack) == 3
-        assert executor.undo_stack[-1] is new_cmd
+        assert list(executor.undo_stack) == [cmds[2], new_cmd]
         
-        # Verify that future commands will maintain the trimming behavior
+        # Raising the limit keeps the existing commands and allows more
+        executor.max_undo_levels = 5
         another_cmd = MockCommand("AnotherCommand")
         executor.execute_command(another_cmd)
         
-        # Still 3 commands (one in, one out)
-        assert len(executor.undo_stack) == 3
-        assert executor.undo_stack[-1] is another_cmd
+        assert list(executor.undo_stack) == [cmds[2], new_cmd, another_cmd]
 
 
 class TestClearHistory:
     """Test cases for clear_history functionality."""
     
-    def test_clear_history_with_commands(self):
+    def test_clear_history_with_commands(self, cmds):
         """Test clearing history when commands exist."""
         executor = CommandExecutor()
-        cmd1 = MockCommand("Command1")
-        cmd2 = MockCommand("Command2")
+        cmd1, cmd2 = cmds[:2]
         
         executor.execute_command(cmd1)
         executor.execute_command(cmd2)
@@ -502,8 +475,7 @@ class TestEdgeCases:
         executor = CommandExecutor()
         command = MockCommand("FailingCommand", should_fail=True, fail_on="execute")
         
-        with patch('builtins.print'):
-            executor.execute_command(command)
+        executor.execute_command(command)
         
         # Command should not be executed or added to stack
         assert not command.executed
@@ -517,10 +489,9 @@ class TestEdgeCases:
         cmd2 = MockCommand("FailingCommand", should_fail=True, fail_on="execute")
         cmd3 = MockCommand("SuccessCommand2")
         
-        with patch('builtins.print'):
-            result1 = executor.execute_command(cmd1)
-            result2 = executor.execute_command(cmd2)
-            result3 = executor.execute_command(cmd3)
+        result1 = executor.execute_command(cmd1)
+        result2 = executor.execute_command(cmd2)
+        result3 = executor.execute_command(cmd3)
         
         assert result1 is True
         assert result2 is False
@@ -0,0 +1,25 @@
+import gc
+
+# Mocking convention: build mocks with ``Mock(spec=SomeClass)`` (a class
+# object, not an instance). That is enough for the ``isinstance`` checks the
+# commands perform and avoids the per-call signature introspection that
+# ``create_autospec`` does. Reach for ``create_autospec`` only when a test needs
+# call-signature checking, and then build it once rather than per test.
+
+# Collection and fixture setup allocate many short-lived Mocks; raising the
+# generation-0 threshold keeps the cyclic GC from sweeping on every burst.
+_GC_THRESHOLD = (50000, 100, 100)
+_original_gc_threshold = None
+
+
+def pytest_configure(config):
+    """Relax GC thresholds for the whole session, including collection."""
+    global _original_gc_threshold
+    _original_gc_threshold = gc.get_threshold()
+    gc.set_threshold(*_GC_THRESHOLD)
+
+
+def pytest_unconfigure(config):
+    """Restore the interpreter's original GC thresholds."""
+    if _original_gc_threshold is not None:
+        gc.set_threshold(*_original_gc_threshold)
@@ -0,0 +1,49 @@
+"""
+Shared fixtures for event tests.
+"""
+
+import pytest
+
+
+class RecordingCallback:
+    """Minimal event callback that records the payloads it receives.
+
+    Used instead of ``Mock`` where a test only needs the received payloads;
+    ``Mock.__call__`` bookkeeping otherwise dominates many-callback tests.
+    """
+
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, data):
+        self.calls.append(data)
+
+
+@pytest.fixture
+def recording_callback():
+    """Factory for ``RecordingCallback`` instances."""
+    return RecordingCallback
+
+
+class CountingCallback:
+    """Event callback that only counts calls, for benchmarks.
+
+    Keeps no reference to payloads, so timings reflect EventBus dispatch
+    rather than callback bookkeeping.
+    """
+
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, data):
+        self.count += 1
+
+
+@pytest.fixture
+def counting_callback():
+    """Factory for ``CountingCallback`` instances."""
+    return CountingCallback
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 from unittest.mock import Mock, call
 
@@ -22,8 +25,8 @@ class TestEventBus:
         event_bus.subscribe("test_event", callback)
         
         assert "test_event" in event_bus._subscribers
-        assert callback in event_bus._subscribers["test_event"]
-        assert len(event_bus._subscribers["test_event"]) == 1
+        assert callback in event_bus.get_subscribers("test_event")
+        assert len(event_bus.get_subscribers("test_event")) == 1
     
     def test_subscribe_multiple_callbacks_same_event(self):
         """Test subscribing multiple callbacks to the same event."""
@@ -36,10 +39,10 @@ class TestEventBus:
         event_bus.subscribe("test_event", callback2)
         event_bus.subscribe("test_event", callback3)
         
-        assert len(event_bus._subscribers["test_event"]) == 3
-        assert callback1 in event_bus._subscribers["test_event"]
-        assert callback2 in event_bus._subscribers["test_event"]
-        assert callback3 in event_bus._subscribers["test_event"]
+        assert len(event_bus.get_subscribers("test_event")) == 3
+        assert callback1 in event_bus.get_subscribers("test_event")
+        assert callback2 in event_bus.get_subscribers("test_event")
+        assert callback3 in event_bus.get_subscribers("test_event")
     
     def test_subscribe_same_callback_multiple_times(self):
         """Test subscribing the same callback multiple times to the same event."""
@@ -51,8 +54,8 @@ class TestEventBus:
         event_bus.subscribe("test_event", callback)
         
         # Should have the callback multiple times (by design)
-        assert len(event_bus._subscribers["test_event"]) == 3
-        assert all(cb == callback for cb in event_bus._subscribers["test_event"])
+        assert len(event_bus.get_subscribers("test_event")) == 3
+        assert all(cb == callback for cb in event_bus.get_subscribers("test_event"))
     
     def test_subscribe_different_events(self):
         """Test subscribing callbacks to different events."""
@@ -70,9 +73,9 @@ class TestEventBus:
         assert "event2" in event_bus._subscribers
         assert "event3" in event_bus._subscribers
         
-        assert callback1 in event_bus._subscribers["event1"]
-        assert callback2 in event_bus._subscribers["event2"]
-        assert callback3 in event_bus._subscribers["event3"]
+        assert callback1 in event_bus.get_subscribers("event1")
+        assert callback2 in event_bus.get_subscribers("event2")
+        assert callback3 in event_bus.get_subscribers("event3")
     
     def test_subscribe_callback_to_multiple_events(self):
         """Test subscribing the same callback to multiple events."""
@@ -84,9 +87,9 @@ class TestEventBus:
         event_bus.subscribe("event3", callback)
         
         assert len(event_bus._subscribers) == 3
-        assert callback in event_bus._subscribers["event1"]
-        assert callback in event_bus._subscribers["event2"]
-        assert callback in event_bus._subscribers["event3"]
+        assert callback in event_bus.get_subscribers("event1")
+        assert callback in event_bus.get_subscribers("event2")
+        assert callback in event_bus.get_subscribers("event3")
     
     def test_emit_no_data(self):
         """Test emitting an event without data."""
@@ -190,6 +193,22 @@ class TestEventBus:
         callback2.assert_called_once_with(expected_data)
         callback3.assert_called_once_with(expected_data)
     
+    def test_emit_builds_one_payload_per_level(self, recording_callback):
+        """Test that all subscribers of a level share one payload dict."""
+        event_bus = EventBus()
+        callbacks = [recording_callback() for _ in range(3)]
+        pattern_callback = recording_callback()
+
+        for callback in callbacks:
+            event_bus.subscribe("test_event", callback)
+        event_bus.subscribe("test*", pattern_callback)
+
+        event_bus.emit("test_event", {"data": "test_data"})
+
+        payload = callbacks[0].calls[0]
+        assert all(callback.calls[0] is payload for callback in callbacks)
+        assert pattern_callback.calls[0] is payload
+
     def test_emit_nonexistent_event(self):
         """Test emitting an event with no subscribers."""
         event_bus = EventBus()
@@ -241,6 +260,26 @@ class TestEventBus:
         callback.assert_has_calls(expected_calls)
         assert callback.call_count == 3
     
+    def test_emit_many(self):
+        """Test emitting a batch of events in order."""
+        event_bus = EventBus()
+        received = []
+
+        def handler(data):
+            received.append((data["event_type"], data.get("data")))
+
+        event_bus.subscribe("event1", handler)
+        event_bus.subscribe("event2", handler)
+
+        event_bus.emit_many([
+            ("event1", {"data": "data1"}),
+            ("event2", None),
+            ("event1", {"data": "data3"}),
+            ("unrelated_event", {"data": "data4"}),
+        ])
+
+        assert received == [("event1", "data1"), ("event2", None), ("event1", "data3")]
+
     def test_callback_exception_handling(self):
         """Test that exceptions in callbacks don't affect other callbacks."""
         event_bus = EventBus()
@@ -276,8 +315,38 @@ class TestEventBus:
         assert another_good_callback.called is True
         assert another_good_callback.data == expected_data
     
+    def test_callback_exception_is_logged(self, caplog):
+        """Test that an isolated callback exception is logged with its event."""
+        event_bus = EventBus()
+
+        def bad_callback(data):
+            raise ValueError("Test exception")
+
+        event_bus.subscribe("test_event", bad_callback)
+
+        with caplog.at_level("ERROR", logger="pandaplot.models.events.event_bus"):
+            event_bus.emit("test_event")
+
+        assert "Error in event callback for test_event" in caplog.text
+        assert "Test exception" in caplog.text
+
+    def test_propagate_exceptions(self):
+        """Test that propagate_exceptions re-raises and stops the emit."""
+        event_bus = EventBus(propagate_exceptions=True)
+        later_callback = Mock()
+
+        def bad_callback(data):
+            raise ValueError("Test exception")
+
+        event_bus.subscribe("test_event", bad_callback)
+        event_bus.subscribe("test_event", later_callback)
+
+        with pytest.raises(ValueError, match="Test exception"):
+            event_bus.emit("test_event")
+        later_callback.assert_not_called()
+
     def test_callback_execution_order(self):
-        """Test callback execution order (note: order is not guaranteed with defaultdict(list))."""
+        """Test that callbacks run in subscription order."""
         event_bus = EventBus()
         execution_order = []
         
@@ -346,7 +415,50 @@ class TestEventBus:
         assert len(subscriber2.received_data) == 1
         assert subscriber1.received_data[0] == expected_data
         assert subscriber2.received_data[0] == expected_data
-    
+
+    @pytest.mark.parametrize("event_pattern", [
+        pytest.param("test_event", id="exact"),
+        pytest.param("test.*", id="pattern"),
+    ])
+    def test_method_callbacks_do_not_keep_subscriber_alive(self, event_pattern):
+        """Test that a bound-method subscription is dropped with its instance."""
+        event_bus = EventBus()
+
+        class TestSubscriber:
+            def handle_event(self, data):
+                pass
+
+        subscriber = TestSubscriber()
+        subscriber_ref = weakref.ref(subscriber)
+        event_bus.subscribe(event_pattern, subscriber.handle_event)
+
+        del subscriber
+        gc.collect()
+
+        assert subscriber_ref() is None
+        assert event_bus.get_subscribers("test_event") == []
+        assert not event_bus._pattern_subscribers
+        event_bus.emit("test_event")
+
+    def test_unsubscribe_method_callback(self):
+        """Test unsubscribing with a fresh bound method of the same instance."""
+        event_bus = EventBus()
+
+        class TestSubscriber:
+            def __init__(self):
+                self.received_data = []
+
+            def handle_event(self, data):
+                self.received_data.append(data)
+
+        subscriber = TestSubscriber()
+        event_bus.subscribe("test_event", subscriber.handle_event)
+        event_bus.unsubscribe("test_event", subscriber.handle_event)
+
+        event_bus.emit("test_event")
+        assert subscriber.received_data == []
+        assert "test_event" not in event_bus._subscribers
+
     def test_mixed_callback_types(self):
         """Test mixing different types of callbacks.""" 
         event_bus = EventBus()
@@ -444,59 +556,108 @@ class TestEventBus:
         callback1.assert_not_called()
         callback2.assert_called_once_with(expected_data)
     
-    def test_defaultdict_behavior(self):
-        """Test that _subscribers uses defaultdict correctly."""
+    def test_get_subscribers_unknown_event(self):
+        """Test that looking up an unknown event does not register it."""
         event_bus = EventBus()
         
-        # Accessing non-existent key should create empty list
-        subscribers = event_bus._subscribers["nonexistent_event"]
-        assert isinstance(subscribers, list)
-        assert len(subscribers) == 0
+        subscribers = event_bus.get_subscribers("nonexistent_event")
+        assert subscribers == []
         
-        # Should now exist in the dict
-        assert "nonexistent_event" in event_bus._subscribers
+        # The lookup must not create an entry
+        assert "nonexistent_event" not in event_bus._subscribers
     
-    def test_stress_test_many_callbacks(self):
+    def test_unsubscribe_demotes_to_single_callback(self):
+        """Test unsubscribing back down to one and then zero callbacks."""
+        event_bus = EventBus()
+        callback1 = Mock()
+        callback2 = Mock()
+        
+        event_bus.subscribe("test_event", callback1)
+        event_bus.subscribe("test_event", callback2)
+        event_bus.unsubscribe("test_event", callback1)
+        
+        assert event_bus.get_subscribers("test_event") == [callback2]
+        event_bus.emit("test_event")
+        callback1.assert_not_called()
+        callback2.assert_called_once()
+        
+        event_bus.unsubscribe("test_event", callback2)
+        assert "test_event" not in event_bus._subscribers
+    
+    def test_unsubscribe_during_emit(self):
+        """Test that changing subscriptions mid-emit affects only later emits."""
+        event_bus = EventBus()
+        late_callback = Mock()
+        second_callback = Mock()
+
+        def first_callback(data):
+            event_bus.unsubscribe("test_event", first_callback)
+            event_bus.subscribe("test_event", late_callback)
+
+        event_bus.subscribe("test_event", first_callback)
+        event_bus.subscribe("test_event", second_callback)
+
+        event_bus.emit("test_event")
+
+        # The running emit keeps its snapshot: nothing skipped, nothing added
+        second_callback.assert_called_once()
+        late_callback.assert_not_called()
+
+        event_bus.emit("test_event")
+        assert second_callback.call_count == 2
+        late_callback.assert_called_once()
+
+    def test_pattern_subscription_changes_after_emit(self, recording_callback):
+        """Test that pattern (un)subscribes apply to events already emitted once."""
+        event_bus = EventBus()
+        first_callback = recording_callback()
+        second_callback = recording_callback()
+
+        event_bus.subscribe("test.*", first_callback)
+        event_bus.emit("test.event")
+
+        event_bus.subscribe("test*", second_callback)
+        event_bus.unsubscribe("test.*", first_callback)
+        event_bus.emit("test.event")
+
+        assert len(first_callback.calls) == 1
+        assert len(second_callback.calls) == 1
+
+    def test_stress_test_many_callbacks(self, recording_callback):
         """Test with many callbacks subscribed to the same event."""
         event_bus = EventBus()
-        callbacks = []
+        callback = recording_callback()
         
-        # Create 100 mock callbacks
+        # Subscribe the same recorder 100 times; duplicates are kept
         for i in range(100):
-            callback = Mock()
-            callbacks.append(callback)
             event_bus.subscribe("stress_test", callback)
         
         test_data = {"data":"test_data"}
         event_bus.emit("stress_test", test_data)
         
-        # All callbacks should have been called with metadata added
+        # Every subscription should have been called with metadata added
         expected_data = {"data":"test_data", "event_type": "stress_test", "original_event": "stress_test"}
-        for callback in callbacks:
-            callback.assert_called_once_with(expected_data)
+        assert callback.calls == [expected_data] * 100
     
-    def test_stress_test_many_events(self):
+    def test_stress_test_many_events(self, recording_callback):
         """Test with many different events."""
         event_bus = EventBus()
-        callbacks = {}
+        callback = recording_callback()
+        event_names = [f"event_{i}" for i in range(100)]
         
-        # Create 100 different events with callbacks
-        for i in range(100):
-            event_name = f"event_{i}"
-            callback = Mock()
-            callbacks[event_name] = callback
+        # Subscribe one recorder to 100 different events
+        for event_name in event_names:
             event_bus.subscribe(event_name, callback)
         
         # Emit all events
-        for i in range(100):
-            event_name = f"event_{i}"
+        for i, event_name in enumerate(event_names):
             event_bus.emit(event_name, {"data": f"data_{i}"})
         
-        # Verify all callbacks were called with correct data
-        for i in range(100):
-            event_name = f"event_{i}"
-            expected_data = {"data": f"data_{i}", "event_type": event_name, "original_event": event_name}
-            callbacks[event_name].assert_called_once_with(expected_data)
+        # Each event should have been delivered once, in emit order
+        assert callback.calls == [
+            {"data": f"data_{i}", "event_type": event_name, "original_event": event_name}
+            for i, event_name in enumerate(event_names)
+        ]
     
     def test_event_names_are_strings(self):
         """Test various event name formats."""
@@ -575,3 +736,31 @@ class TestEventBus:
         assert "LOG: INFO - User logged out" in log_entries
         
         assert metrics["events_processed"] == 3
+
+
+class TestEventBusBenchmark:
+    """Benchmarks for EventBus.emit.
+    
+    Run with ``pytest --benchmark-enable --benchmark-only``; otherwise each
+    benchmark executes once as a plain test.
+    """
+
+    @pytest.mark.parametrize("subscriptions, event_type, expected_calls", [
+        pytest.param([], "test_event", 0, id="no_listeners"),
+        pytest.param(["test_event"], "test_event", 1, id="single_listener"),
+        pytest.param(["test_event"] * 10, "test_event", 10, id="ten_listeners"),
+        pytest.param(["project.changed", "folder.*"], "folder.created", 2, id="hierarchy_and_pattern"),
+    ])
+    def test_emit_benchmark(self, benchmark, counting_callback, subscriptions, event_type, expected_calls):
+        """Benchmark one emit() with cheap counting callbacks."""
+        event_bus = EventBus()
+        callback = counting_callback()
+        for event_pattern in subscriptions:
+            event_bus.subscribe(event_pattern, callback)
+        data = {"item_id": "item-123", "source_component": "Benchmark"}
+
+        benchmark(event_bus.emit, event_type, data)
+
+        callback.count = 0
+        event_bus.emit(event_type, data)
+        assert callback.count == expected_calls
@@ -118,7 +118,7 @@ class TestObservable:
         observable = Observable()
         
         assert hasattr(observable, '_observers')
-        assert isinstance(observable._observers, set)
+        assert isinstance(observable._observers, list)
         assert len(observable._observers) == 0
     
     def test_add_observer(self):
@@ -204,6 +204,25 @@ class TestObservable:
         assert received_events1[0] == event
         assert received_events2[0] == event
     
+    def test_remove_observer_callback(self):
+        """Test removing a callback added with add_observer_callback."""
+        observable = Observable()
+        received_events = []
+        observer = MockObserver()
+
+        def callback(event: Event):
+            received_events.append(event)
+
+        observable.add_observer_callback(callback)
+        observable.add_observer(observer)
+        observable.remove_observer(callback)
+
+        event = Event("test_event", "test_data")
+        observable.notify(event)
+
+        assert received_events == []
+        assert observer.received_events == [event]
+
     def test_remove_observer(self):
         """Test removing an observer."""
         observable = Observable()
@@ -282,6 +301,43 @@ class TestObservable:
         assert observer2.received_events[0] == event
         assert observer3.received_events[0] == event
     
+    def test_notify_order(self):
+        """Test that observers are notified in the order they were added."""
+        observable = Observable()
+        order = []
+
+        class OrderObserver(Observer):
+            def __init__(self, name):
+                self.name = name
+
+            def update(self, event: Event):
+                order.append(self.name)
+
+        for name in ("first", "second", "third"):
+            observable.add_observer(OrderObserver(name))
+
+        observable.notify(Event("test_event"))
+
+        assert order == ["first", "second", "third"]
+
+    def test_remove_observer_during_notify(self):
+        """Test that an observer removing itself mid-notify skips no one."""
+        observable = Observable()
+        other_observer = MockObserver()
+
+        class OneShotObserver(Observer):
+            def update(self, event: Event):
+                observable.remove_observer(self)
+
+        observable.add_observer(OneShotObserver())
+        observable.add_observer(other_observer)
+
+        observable.notify(Event("event1"))
+        observable.notify(Event("event2"))
+
+        assert len(other_observer.received_events) == 2
+        assert len(observable._observers) == 1
+
     def test_notify_no_observers(self):
         """Test notifying when there are no observers."""
         observable = Observable()
@@ -416,12 +472,9 @@ class TestObservable:
         assert callback_events[0] == event
     
     def test_observer_set_behavior(self):
-        """Test that observers are stored in a set (no ordering guarantees)."""
+        """Test that observers are de-duplicated by equality, like a set."""
         observable = Observable()
         
-        # Test that _observers is indeed a set
-        assert isinstance(observable._observers, set)
-        
         # Test set-like behavior with custom observer classes
         class NamedObserver(Observer):
             def __init__(self, name):